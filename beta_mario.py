@@ -8,11 +8,21 @@ import time
 # --- CONSTANTS ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-LEVEL_WIDTH = 1600
+LEVEL_WIDTH = 1600  # default for WORLD_DATA levels without a "width"
+LONG_LEVEL_WIDTH = 100000
+CHUNK_WIDTH = 800  # levels are loaded and freed in chunks this wide
+CLOUD_PARALLAX = 0.8
+# Never-changing level sprites drawn under everything else, baked per chunk
+# into one surface in this order. Pipes, hazards and checkpoints also never
+# change but go over moving platforms or pickups, so they are drawn per sprite
+STATIC_LAYER_KEYS = ("bushes", "platforms")
+LAYER_KEY = (255, 0, 255)  # transparent colour of the baked layers
+TEXT_CACHE_LIMIT = 256  # rendered strings kept before the cache starts over
 FPS = 60
 GRAVITY = 0.7
 JUMP_STRENGTH = -13
 PLAYER_SPEED = 5
+GRID_CELL_SIZE = 128  # broad-phase cell, a few tiles wide
 
 # --- THEME DATA ---
 WORLD_THEMES = [
@@ -50,6 +60,89 @@ bushes = pygame.sprite.Group()
 clouds = pygame.sprite.Group()
 moving_platforms = pygame.sprite.Group()
 goal = None
+level_width = LEVEL_WIDTH
+
+class SpatialGrid:
+    """Uniform-grid broad phase over sprite rects.
+
+    Each sprite is filed under every cell its rect overlaps, so a query
+    only looks at sprites near the given rect. Queries name the group they
+    want, which also drops sprites that have since left it.
+    """
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell_range(self, rect):
+        c = self.cell_size
+        return (range(rect.left // c, (rect.right - 1) // c + 1),
+                range(rect.top // c, (rect.bottom - 1) // c + 1))
+
+    def add(self, sprite):
+        xs, ys = self.cell_range(sprite.rect)
+        for cx in xs:
+            for cy in ys:
+                self.cells.setdefault((cx, cy), []).append(sprite)
+
+    def remove(self, sprite):
+        xs, ys = self.cell_range(sprite.rect)
+        for cx in xs:
+            for cy in ys:
+                cell = self.cells.get((cx, cy))
+                if cell is not None and sprite in cell:
+                    cell.remove(sprite)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def rebuild(self, *groups):
+        self.cells.clear()
+        for group in groups:
+            for sprite in group:
+                self.add(sprite)
+
+    def query(self, rect, group):
+        found = {}
+        xs, ys = self.cell_range(rect)
+        for cx in xs:
+            for cy in ys:
+                for sprite in self.cells.get((cx, cy), ()):
+                    if sprite in group:
+                        found[sprite] = None
+        return list(found)
+
+# Level geometry, pickups and checkpoints; built once per level
+static_index = SpatialGrid()
+# Enemies and moving platforms; rebuilt every frame after they move
+dynamic_index = SpatialGrid()
+
+class TextCache:
+    """Fonts loaded once per (name, size), and rendered text kept per
+    (font, text, colour), so drawing a label is a dict lookup and a blit."""
+    def __init__(self):
+        self.fonts = {}
+        self.surfaces = {}
+
+    def font(self, name, size):
+        font = self.fonts.get((name, size))
+        if font is None:
+            font = self.fonts[(name, size)] = pygame.font.SysFont(name, size)
+        return font
+
+    def render(self, text, color, name=None, size=32):
+        key = (name, size, text, color)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            if len(self.surfaces) >= TEXT_CACHE_LIMIT:
+                self.surfaces.clear()  # e.g. a long run of coin counts
+            surf = self.surfaces[key] = self.font(name, size).render(text, True, color)
+        return surf
+
+text_cache = TextCache()
+
+def draw_visible(sprites, view):
+    for sprite in sprites:
+        if sprite.rect.colliderect(view):
+            screen.blit(sprite.image, (sprite.rect.x - view.x, sprite.rect.y))
 
 # --- Powerup States ---
 POWER_NONE = "none"
@@ -98,21 +191,21 @@ class Player(pygame.sprite.Sprite):
         self.rect.y += self.vel_y
         self.on_ground = False
 
-        for platform in platforms:
+        for platform in static_index.query(self.rect, platforms):
             if self.rect.colliderect(platform.rect) and self.vel_y >= 0:
                 if self.rect.bottom <= platform.rect.bottom:
                     self.rect.bottom = platform.rect.top
                     self.vel_y = 0
                     self.on_ground = True
 
-        for mplat in moving_platforms:
+        for mplat in dynamic_index.query(self.rect, moving_platforms):
             if self.rect.colliderect(mplat.rect) and self.vel_y >= 0:
                 if self.rect.bottom <= mplat.rect.bottom:
                     self.rect.bottom = mplat.rect.top
                     self.vel_y = 0
                     self.on_ground = True
 
-        for pipe in pipes:
+        for pipe in static_index.query(self.rect, pipes):
             if self.rect.colliderect(pipe.rect) and self.vel_y >= 0:
                 if self.rect.bottom <= pipe.rect.bottom:
                     self.rect.bottom = pipe.rect.top
@@ -154,7 +247,7 @@ class Player(pygame.sprite.Sprite):
             self.facing_right = True
 
     def check_enemy_collision(self):
-        for enemy in list(enemies):
+        for enemy in dynamic_index.query(self.rect, enemies):
             if self.rect.colliderect(enemy.rect):
                 if self.rect.bottom <= enemy.rect.top + 10 and self.vel_y > 0:
                     enemies.remove(enemy)
@@ -184,7 +277,7 @@ class Player(pygame.sprite.Sprite):
                 powerups.remove(powerup)
 
     def check_hazard_collision(self):
-        for hazard in hazards:
+        for hazard in static_index.query(self.rect, hazards):
             if self.rect.colliderect(hazard.rect):
                 if not self.star_active and not self.flower and not self.has_mushroom:
                     pygame.quit()
@@ -197,31 +290,31 @@ class Player(pygame.sprite.Sprite):
                     self.has_mushroom = False
 
     def check_checkpoint_collision(self, current_level_name):
-        for checkpoint in checkpoints:
+        for checkpoint in static_index.query(self.rect, checkpoints):
             if self.rect.colliderect(checkpoint.rect):
                 save_checkpoint(current_level_name, self.rect.midbottom, self.flower or self.has_mushroom)
 
-    def collect_coins_and_blocks(self):
-        for coin in list(coins):
+    def collect_coins_and_blocks(self, level_manager):
+        for coin in static_index.query(self.rect, coins):
             if self.rect.colliderect(coin.rect):
                 coins.remove(coin)
                 self.score += 1
 
-        for block in blocks:
+        for block in static_index.query(self.rect, blocks):
             if not block.popped and self.rect.colliderect(block.rect) and self.vel_y < 0 and abs(self.rect.top - block.rect.bottom) < 20:
                 block.popped = True
                 # Randomize powerup/coin if marked
                 if block.contains == "coin":
-                    coins.add(Coin(block.rect.centerx, block.rect.top - 18))
+                    level_manager.adopt(Coin(block.rect.centerx, block.rect.top - 18), coins)
                 elif block.contains == "mushroom":
-                    powerups.add(PowerUp(block.rect.centerx, block.rect.top - 20, POWER_MUSHROOM))
+                    level_manager.adopt(PowerUp(block.rect.centerx, block.rect.top - 20, POWER_MUSHROOM), powerups)
                 elif block.contains == "flower":
-                    powerups.add(PowerUp(block.rect.centerx, block.rect.top - 20, POWER_FLOWER))
+                    level_manager.adopt(PowerUp(block.rect.centerx, block.rect.top - 20, POWER_FLOWER), powerups)
                 elif block.contains == "star":
-                    powerups.add(PowerUp(block.rect.centerx, block.rect.top - 20, POWER_STAR))
+                    level_manager.adopt(PowerUp(block.rect.centerx, block.rect.top - 20, POWER_STAR), powerups)
                 elif block.contains == "?" and True:
                     ptype = random.choice([POWER_MUSHROOM, POWER_FLOWER, POWER_STAR])
-                    powerups.add(PowerUp(block.rect.centerx, block.rect.top - 20, ptype))
+                    level_manager.adopt(PowerUp(block.rect.centerx, block.rect.top - 20, ptype), powerups)
 
     def handle_star_timer(self):
         if self.star_active and time.time() > self.star_end_time:
@@ -240,7 +333,7 @@ class Player(pygame.sprite.Sprite):
         self.check_enemy_collision()
         self.check_powerup_collision()
         self.check_hazard_collision()
-        self.collect_coins_and_blocks()
+        self.collect_coins_and_blocks(level_manager)
         self.handle_star_timer()
         self.check_checkpoint_collision(level_manager.current_level)
         self.falling_in_pit()
@@ -256,13 +349,19 @@ class Goomba(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(midbottom=(x, y))
         self.direction = -1
         self.home_platforms = platform_list
-        matching_tops = [pf.rect.left for pf in self.home_platforms if abs(y - pf.rect.top) < 3]
-        if any(matching_tops):
-            self.platform_left = min([pf.rect.left for pf in self.home_platforms if abs(y - pf.rect.top) < 3])
-            self.platform_right = max([pf.rect.right for pf in self.home_platforms if abs(y - pf.rect.top) < 3])
+        # Patrol the run of touching platforms underfoot (ground is cut at
+        # chunk edges), not every platform at this height across pits
+        spans = []
+        for left, right in sorted((pf.rect.left, pf.rect.right) for pf in self.home_platforms if abs(y - pf.rect.top) < 3):
+            if spans and left <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], right)
+            else:
+                spans.append([left, right])
+        if spans:
+            self.platform_left, self.platform_right = min(spans, key=lambda span: max(span[0] - x, x - span[1], 0))
         else:
             self.platform_left = 0
-            self.platform_right = LEVEL_WIDTH
+            self.platform_right = level_width
 
     def update(self):
         self.rect.x += self.direction * 2
@@ -340,14 +439,14 @@ class Fireball(pygame.sprite.Sprite):
         self.rect.y += self.vy
         self.vy += GRAVITY*0.25
         # Platform bounce
-        for g in platforms:
+        for g in static_index.query(self.rect, platforms):
             if self.rect.colliderect(g.rect) and self.vy > 0:
                 self.vy = -4  # bounce up
         # Remove out of bounds
-        if self.rect.left > LEVEL_WIDTH or self.rect.right < 0 or self.rect.top > SCREEN_HEIGHT:
+        if self.rect.left > level_width or self.rect.right < 0 or self.rect.top > SCREEN_HEIGHT:
             self.kill()
         # Hit enemy
-        for enemy in enemies:
+        for enemy in dynamic_index.query(self.rect, enemies):
             if self.rect.colliderect(enemy.rect):
                 enemies.remove(enemy)
                 self.kill()
@@ -379,19 +478,28 @@ class QuestionBlock(pygame.sprite.Sprite):
         super().__init__()
         self.image = pygame.Surface((32,32), pygame.SRCALPHA)
         self.contains = contains
-        self.popped = False
+        self._popped = False
         self.render_block()
         self.rect = self.image.get_rect(topleft=(x,y))
 
+    @property
+    def popped(self):
+        return self._popped
+
+    @popped.setter
+    def popped(self, value):
+        # The image only changes with popped, so redraw only then
+        if value != self._popped:
+            self._popped = value
+            self.render_block()
+
     def render_block(self):
         self.image.fill((0,0,0,0))
         col = (220,180,80) if not self.popped else (170,130,70)
         pygame.draw.rect(self.image, col, (0,0,32,32))
         pygame.draw.rect(self.image, (160,120,40), (0,0,32,32), 2)
         if not self.popped:
-            font = pygame.font.SysFont(None, 28)
-            q = font.render("?", True, (190,120,40))
-            self.image.blit(q, (8, 0))
+            self.image.blit(text_cache.render("?", (190,120,40), size=28), (8, 0))
         else:
             pygame.draw.rect(self.image, (180,120,70), (7,7,18,18))
 
@@ -542,55 +650,121 @@ def clear_checkpoint():
     if os.path.exists(CHECKPOINT_FILE):
         os.remove(CHECKPOINT_FILE)
 
+def split_level(lvl, width):
+    """Cut a WORLD_DATA level into CHUNK_WIDTH-wide chunk dicts.
+
+    Platforms and hazards are cut at chunk edges; everything else goes to
+    the chunk holding its x (clouds by where the parallax shows them).
+    """
+    count = max(1, -(-width // CHUNK_WIDTH))
+    chunks = [{} for _ in range(count)]
+    def put(key, x, item):
+        index = min(count - 1, max(0, int(x) // CHUNK_WIDTH))
+        chunks[index].setdefault(key, []).append(item)
+    for key in ("platforms", "hazards"):
+        for x, y, w, h in lvl.get(key, []):
+            while w > 0:
+                piece = min(w, (x // CHUNK_WIDTH + 1) * CHUNK_WIDTH - x)
+                put(key, x, (x, y, piece, h))
+                x += piece
+                w -= piece
+    for key in ("moving_platforms", "enemies", "powerups", "checkpoints", "coins", "blocks", "pipes", "bushes"):
+        for item in lvl.get(key, []):
+            put(key, item[0], item)
+    for item in lvl.get("clouds", []):
+        put("clouds", item[0] / CLOUD_PARALLAX, item)
+    return chunks
+
+def level_chunks(lvl):
+    # (width, chunk index -> chunk dict) for either level format
+    if "chunk" in lvl:
+        return lvl["width"], lvl["chunk"]
+    width = lvl.get("width", LEVEL_WIDTH)
+    return width, split_level(lvl, width).__getitem__
+
+def long_level(seed, width=LONG_LEVEL_WIDTH, ground=SCREEN_HEIGHT - 50):
+    """A procedural level in the chunked format: each chunk is rebuilt
+    from (seed, index) when the camera reaches it, so only the recipe
+    stays in memory however wide the level is."""
+    last = -(-width // CHUNK_WIDTH) - 1
+    def chunk(index):
+        rng = random.Random(seed * 1000003 + index)
+        left = index * CHUNK_WIDTH
+        safe = index == 0 or index == last
+        data = {key: [] for key in ("platforms", "enemies", "coins", "blocks", "pipes", "hazards",
+                                    "bushes", "clouds", "checkpoints")}
+        if index % 10 == 0 and index:
+            data["checkpoints"].append((left + 100, ground))
+        for seg in range(CHUNK_WIDTH // 200):
+            x = left + seg * 200
+            if not safe and seg and rng.random() < 0.15:
+                data["platforms"].append((x + 90, ground, 110, 50))  # a pit to jump
+            else:
+                data["platforms"].append((x, ground, 200, 50))
+                roll = rng.random()
+                if not safe and roll < 0.3:
+                    data["enemies"].append((x + rng.randint(40, 160), ground))
+                elif not safe and roll < 0.4:
+                    data["hazards"].append((x + 60, ground, 60, 16))
+                elif roll < 0.5:
+                    data["pipes"].append((x + 130, ground, rng.choice((70, 90))))
+                elif roll < 0.6:
+                    data["bushes"].append((x + 20, ground, 60))
+            if rng.random() < 0.3:
+                py = ground - rng.choice((80, 100))
+                data["platforms"].append((x + 40, py, 120, 16))
+                data["coins"].extend((x + 55 + 30 * i, py - 25) for i in range(4))
+            elif rng.random() < 0.15:
+                data["blocks"].append((x + 84, ground - 130, rng.choice(("coin", "?"))))
+            if rng.random() < 0.2:
+                data["clouds"].append((int((x + 100) * CLOUD_PARALLAX), rng.randint(40, 160)))
+        return data
+    return {"width": width, "goal_y": ground, "chunk": chunk}
+
+for _idx, _wname in enumerate(WORLD_LIST):
+    WORLD_DATA[f"{_wname}_2"] = long_level(seed=_idx + 1)
+
 class LevelManager:
+    """Loads levels and streams their chunks around the camera.
+
+    Chunks within one chunk of the screen are instantiated and indexed;
+    chunks two or more behind are freed. On unload a chunk keeps which
+    coins were taken, which blocks popped and where the surviving
+    enemies standing in it were, and comes back that way.
+    """
     def __init__(self, player):
         self.player = player
         self.completed_levels = []
         self.current_level = LEVEL_LIST[0]
+        self.width = LEVEL_WIDTH
+        self.chunk_count = 0
+        self.chunk_source = None
+        self.loaded = {}       # chunk index -> [(key, item index, sprite)]
+        self.chunk_state = {}  # chunk index -> what changed before it was unloaded
+        self.layers = {}       # chunk index -> baked static layer, made on first draw
+        self.hazard_color = WORLD_THEMES[0]["hazard_color"]
 
     def load_level(self, level_name, player_restore_pos=None, powered=False):
-        global platforms, enemies, powerups, fireballs, hazards, checkpoints
-        global coins, blocks, pipes, bushes, clouds, moving_platforms, goal
-        platforms.empty(); enemies.empty(); powerups.empty(); fireballs.empty()
-        hazards.empty(); checkpoints.empty(); coins.empty(); blocks.empty()
-        pipes.empty(); bushes.empty(); clouds.empty(); moving_platforms.empty()
+        for group in (platforms, enemies, powerups, fireballs, hazards, checkpoints,
+                      coins, blocks, pipes, bushes, clouds, moving_platforms):
+            group.empty()
+        static_index.rebuild()
+        dynamic_index.rebuild()
+        self.loaded = {}
+        self.chunk_state = {}
+        self.layers = {}
         if level_name not in WORLD_DATA:
             print(f"Level '{level_name}' not found.")
             return
         lvl = WORLD_DATA[level_name]
         wname = level_name.split('_')[0]
         widx  = WORLD_LIST.index(wname)
-        hazard_color = WORLD_THEMES[widx]["hazard_color"]
-        plat_objs = []
-        for plat in lvl.get("platforms", []):
-            pf = Platform(*plat)
-            platforms.add(pf)
-            plat_objs.append(pf)
-        mplat_objs = []
-        for mplat in lvl.get("moving_platforms", []):
-            mpf = MovingPlatform(*mplat)
-            moving_platforms.add(mpf)
-            mplat_objs.append(mpf)
-        for ex, ey in lvl.get("enemies", []):
-            all_plats = plat_objs + mplat_objs
-            home_plats = [pf for pf in all_plats if abs(pf.rect.top - ey) < 3]
-            if not home_plats and all_plats:
-                home_plats = [min(all_plats, key=lambda pf: abs(pf.rect.top - ey))]
-            enemies.add(Goomba(ex, ey, home_plats))
-        for px,py in lvl.get("powerups", []): powerups.add(PowerUp(px,py,POWER_MUSHROOM))
-        for hx, hy, hw, hh in lvl.get("hazards", []):
-            hazards.add(Hazard(hx, hy, hw, hh, hazard_color))
-        for cx,cy in lvl.get("checkpoints", []): checkpoints.add(Checkpoint(cx,cy))
-        for coinx, coiny in lvl.get("coins", []): coins.add(Coin(coinx, coiny))
-        for bx, by, content in lvl.get("blocks", []): blocks.add(QuestionBlock(bx, by, content))
-        for piped in lvl.get("pipes", []): pipes.add(Pipe(*piped))
-        for bushd in lvl.get("bushes", []): bushes.add(Bush(*bushd))
-        for cloudpos in lvl.get("clouds", []): clouds.add(Cloud(*cloudpos))
-        if "goal_y" in lvl:
-            goal_y = lvl["goal_y"]
-        else:
-            goal_y = SCREEN_HEIGHT-50
-        globals()['goal'] = Goal(LEVEL_WIDTH - 56, goal_y)
+        self.hazard_color = WORLD_THEMES[widx]["hazard_color"]
+        self.width, self.chunk_source = level_chunks(lvl)
+        self.chunk_count = max(1, -(-self.width // CHUNK_WIDTH))
+        globals()['level_width'] = self.width
+        goal_y = lvl.get("goal_y", SCREEN_HEIGHT-50)
+        globals()['goal'] = Goal(self.width - 56, goal_y)
         if player_restore_pos:
             self.player.rect.midbottom = player_restore_pos
         else:
@@ -598,6 +772,153 @@ class LevelManager:
         self.player.flower = powered  # fallback to flower if saved as True
         self.player.has_mushroom = (not powered and self.player.has_mushroom)
         self.current_level = level_name
+        self.stream(self.camera_x())
+        dynamic_index.rebuild(enemies, moving_platforms)
+
+    def camera_x(self):
+        camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
+        return max(0, min(camera_x, self.width - SCREEN_WIDTH))
+
+    def stream(self, camera_x):
+        first = max(0, camera_x // CHUNK_WIDTH - 1)
+        last = min(self.chunk_count - 1, (camera_x + SCREEN_WIDTH) // CHUNK_WIDTH + 1)
+        # One chunk of slack either side so turning round at an edge
+        # doesn't reload the same chunk every frame
+        gone = [i for i in self.loaded if i < first - 1 or i > last + 1]
+        for index in gone:
+            self.rehome_enemies(index)
+        for index in gone:
+            self.unload_chunk(index)
+        fresh = [index for index in range(first, last + 1) if index not in self.loaded]
+        for index in fresh:
+            self.load_chunk(index)
+        # Enemies last, so their patrol can span platforms of neighbouring chunks
+        for index in fresh:
+            state = self.chunk_state.get(index)
+            if state is not None:
+                spawns = state["enemies"]
+            else:
+                spawns = [(ex, ey, -1) for ex, ey in self.chunk_source(index).get("enemies", [])]
+            for i, (ex, ey, direction) in enumerate(spawns):
+                goomba = self.spawn_enemy(ex, ey)
+                goomba.direction = direction
+                self.loaded[index].append(("enemies", i, goomba))
+
+    def load_chunk(self, index):
+        data = self.chunk_source(index)
+        state = self.chunk_state.get(index, {})
+        taken = state.get("coins", ())
+        popped = state.get("blocks", ())
+        owned = self.loaded[index] = []
+        def add(key, i, sprite, group, indexed=True):
+            group.add(sprite)
+            if indexed:
+                static_index.add(sprite)
+            owned.append((key, i, sprite))
+        for i, plat in enumerate(data.get("platforms", [])):
+            add("platforms", i, Platform(*plat), platforms)
+        for i, mplat in enumerate(data.get("moving_platforms", [])):
+            add("moving_platforms", i, MovingPlatform(*mplat), moving_platforms, indexed=False)
+        for i, (px, py) in enumerate(data.get("powerups", [])):
+            add("powerups", i, PowerUp(px, py, POWER_MUSHROOM), powerups, indexed=False)
+        for i, (hx, hy, hw, hh) in enumerate(data.get("hazards", [])):
+            add("hazards", i, Hazard(hx, hy, hw, hh, self.hazard_color), hazards)
+        for i, (cx, cy) in enumerate(data.get("checkpoints", [])):
+            add("checkpoints", i, Checkpoint(cx, cy), checkpoints)
+        for i, (coinx, coiny) in enumerate(data.get("coins", [])):
+            if i not in taken:
+                add("coins", i, Coin(coinx, coiny), coins)
+        for i, (bx, by, content) in enumerate(data.get("blocks", [])):
+            block = QuestionBlock(bx, by, content)
+            if i in popped:
+                block.popped = True
+            add("blocks", i, block, blocks)
+        for i, piped in enumerate(data.get("pipes", [])):
+            add("pipes", i, Pipe(*piped), pipes)
+        for i, bushd in enumerate(data.get("bushes", [])):
+            add("bushes", i, Bush(*bushd), bushes, indexed=False)
+        for i, cloudpos in enumerate(data.get("clouds", [])):
+            add("clouds", i, Cloud(*cloudpos), clouds, indexed=False)
+
+    def rehome_enemies(self, index):
+        # Enemies walk; before a chunk is saved, hand each one over to the
+        # chunk it now stands in, so only enemies out of view get unloaded
+        kept = []
+        for entry in self.loaded[index]:
+            key, i, sprite = entry
+            home = min(self.chunk_count - 1, max(0, sprite.rect.centerx // CHUNK_WIDTH))
+            if key != "enemies" or home == index or not sprite.alive():
+                kept.append(entry)
+            elif home in self.loaded:
+                self.loaded[home].append(entry)
+            else:
+                # Walked off into a chunk that is not loaded: save it there
+                state = self.chunk_state.get(home)
+                if state is None:
+                    spawns = [(ex, ey, -1) for ex, ey in self.chunk_source(home).get("enemies", [])]
+                    state = self.chunk_state[home] = {"enemies": spawns, "coins": set(), "blocks": set()}
+                state["enemies"].append((sprite.rect.centerx, sprite.rect.bottom, sprite.direction))
+                sprite.kill()
+        self.loaded[index] = kept
+
+    def unload_chunk(self, index):
+        state = self.chunk_state.setdefault(index, {"enemies": [], "coins": set(), "blocks": set()})
+        state["enemies"] = []
+        self.layers.pop(index, None)
+        for key, i, sprite in self.loaded.pop(index):
+            if key == "enemies":
+                if sprite.alive():
+                    state["enemies"].append((sprite.rect.centerx, sprite.rect.bottom, sprite.direction))
+            elif key == "coins" and not sprite.alive():
+                state["coins"].add(i)
+            elif key == "blocks" and sprite.popped:
+                state["blocks"].add(i)
+            static_index.remove(sprite)
+            sprite.kill()
+
+    def static_layer(self, index):
+        layer = self.layers.get(index)
+        if layer is None:
+            # Neighbours are loaded whenever a chunk is on screen; their
+            # bushes may reach into this one
+            left = index * CHUNK_WIDTH
+            layer = pygame.Surface((CHUNK_WIDTH, SCREEN_HEIGHT)).convert()
+            layer.fill(LAYER_KEY)
+            for layer_key in STATIC_LAYER_KEYS:
+                for near in (index - 1, index, index + 1):
+                    for key, i, sprite in self.loaded.get(near, ()):
+                        if key == layer_key:
+                            layer.blit(sprite.image, (sprite.rect.x - left, sprite.rect.y))
+            layer.set_colorkey(LAYER_KEY, pygame.RLEACCEL)
+            self.layers[index] = layer
+        return layer
+
+    def draw_static(self, surface, camera_x):
+        # The viewport covers at most two chunks: one area blit from each
+        last = min(self.chunk_count - 1, (camera_x + SCREEN_WIDTH - 1) // CHUNK_WIDTH)
+        for index in range(camera_x // CHUNK_WIDTH, last + 1):
+            left = index * CHUNK_WIDTH
+            x = max(camera_x, left)
+            right = min(camera_x + SCREEN_WIDTH, left + CHUNK_WIDTH)
+            area = pygame.Rect(x - left, 0, right - x, SCREEN_HEIGHT)
+            surface.blit(self.static_layer(index), (x - camera_x, 0), area)
+
+    def spawn_enemy(self, ex, ey):
+        all_plats = list(platforms) + list(moving_platforms)
+        home_plats = [pf for pf in all_plats if abs(pf.rect.top - ey) < 3]
+        if not home_plats and all_plats:
+            home_plats = [min(all_plats, key=lambda pf: abs(pf.rect.top - ey))]
+        goomba = Goomba(ex, ey, home_plats)
+        enemies.add(goomba)
+        return goomba
+
+    def adopt(self, sprite, group):
+        # Pickups popped out of blocks belong to the chunk they appear in
+        group.add(sprite)
+        static_index.add(sprite)
+        index = min(self.chunk_count - 1, max(0, sprite.rect.centerx // CHUNK_WIDTH))
+        if index in self.loaded:
+            self.loaded[index].append(("spawned", -1, sprite))
 
     def goal_reached(self):
         if self.current_level not in self.completed_levels:
@@ -605,8 +926,6 @@ class LevelManager:
         overworld_select(self)
 
 def overworld_select(level_manager):
-    font = pygame.font.SysFont("Arial", 36)
-    small_font = pygame.font.SysFont("Arial", 26)
     sel = 0
     while True:
         screen.fill((92,215,255))
@@ -616,8 +935,8 @@ def overworld_select(level_manager):
             lx = start_x + idx * 85
             wtheme = WORLD_THEMES[idx]['bg_color']
             pygame.draw.circle(screen, wtheme, (lx, y), 38)
-            txt = font.render(str(idx+1), True, (40,40,40))
-            wname = small_font.render(WORLD_THEMES[idx]['name'], True, (60,60,60))
+            txt = text_cache.render(str(idx+1), (40,40,40), "Arial", 36)
+            wname = text_cache.render(WORLD_THEMES[idx]['name'], (60,60,60), "Arial", 26)
             screen.blit(txt, (lx-12, y-22))
             screen.blit(wname, (lx-35, y+44))
             if lvl in level_manager.completed_levels:
@@ -626,7 +945,7 @@ def overworld_select(level_manager):
                 pygame.draw.circle(screen, (255,245,200), (lx, y), 48, 5)
             if idx < len(LEVEL_LIST)-1:
                 pygame.draw.line(screen, (50,43,30), (lx+38, y), (lx+47, y), 5)
-        screen.blit(small_font.render("Left/Right to select, ENTER to play (F=Fire)", True, (30,30,30)), (60, y+100))
+        screen.blit(text_cache.render("Left/Right to select, ENTER to play, L for the long level (F=Fire)", (30,30,30), "Arial", 26), (60, y+100))
         pygame.display.flip()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -640,6 +959,9 @@ def overworld_select(level_manager):
                 if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                     level_manager.load_level(LEVEL_LIST[sel])
                     return
+                if event.key == pygame.K_l:
+                    level_manager.load_level(f"{WORLD_LIST[sel]}_2")
+                    return
 
 player = Player()
 checkpoint_data = load_checkpoint()
@@ -668,49 +990,39 @@ while running:
             running = False
 
     player_group.update(level_manager)
+    level_manager.stream(level_manager.camera_x())
     enemies.update()
     moving_platforms.update()
+    dynamic_index.rebuild(enemies, moving_platforms)
     fireballs.update()
 
     cur_worldname = level_manager.current_level.split('_')[0]
     theme_idx = WORLD_LIST.index(cur_worldname) if cur_worldname in WORLD_LIST else 0
     bg_color = WORLD_THEMES[theme_idx]['bg_color']
 
-    camera_x = player.rect.centerx - SCREEN_WIDTH // 2
-    camera_x = max(0, min(camera_x, LEVEL_WIDTH - SCREEN_WIDTH))
+    camera_x = level_manager.camera_x()
 
     screen.fill(bg_color)
+    view = pygame.Rect(camera_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    cloud_x = int(camera_x * CLOUD_PARALLAX)
     for cloud in clouds:
-        screen.blit(cloud.image, (cloud.rect.x - int(camera_x * 0.8), cloud.rect.y))
-    for bush in bushes:
-        screen.blit(bush.image, (bush.rect.x - camera_x, bush.rect.y))
-    for plat in platforms:
-        screen.blit(plat.image, (plat.rect.x - camera_x, plat.rect.y))
-    for mplat in moving_platforms:
-        screen.blit(mplat.image, (mplat.rect.x - camera_x, mplat.rect.y))
-    for pipe in pipes:
-        screen.blit(pipe.image, (pipe.rect.x - camera_x, pipe.rect.y))
-    for block in blocks:
-        block.render_block()
-        screen.blit(block.image, (block.rect.x - camera_x, block.rect.y))
-    for coin in coins:
-        screen.blit(coin.image, (coin.rect.x - camera_x, coin.rect.y))
-    for enemy in enemies:
-        screen.blit(enemy.image, (enemy.rect.x - camera_x, enemy.rect.y))
-    for fireball in fireballs:
-        screen.blit(fireball.image, (fireball.rect.x - camera_x, fireball.rect.y))
-    for powerup in powerups:
-        screen.blit(powerup.image, (powerup.rect.x - camera_x, powerup.rect.y))
-    for hazard in hazards:
-        screen.blit(hazard.image, (hazard.rect.x - camera_x, hazard.rect.y))
-    for checkpoint in checkpoints:
-        screen.blit(checkpoint.image, (checkpoint.rect.x - camera_x, checkpoint.rect.y))
+        if cloud.rect.right > cloud_x and cloud.rect.left < cloud_x + SCREEN_WIDTH:
+            screen.blit(cloud.image, (cloud.rect.x - cloud_x, cloud.rect.y))
+    level_manager.draw_static(screen, camera_x)
+    draw_visible(moving_platforms, view)
+    draw_visible(static_index.query(view, pipes), view)
+    draw_visible(static_index.query(view, blocks), view)
+    draw_visible(static_index.query(view, coins), view)
+    draw_visible(enemies, view)
+    draw_visible(fireballs, view)
+    draw_visible(powerups, view)
+    draw_visible(static_index.query(view, hazards), view)
+    draw_visible(static_index.query(view, checkpoints), view)
     if goal is not None:
         screen.blit(goal.image, (goal.rect.x - camera_x, goal.rect.y))
     for entity in player_group:
         screen.blit(entity.image, (entity.rect.x - camera_x, entity.rect.y))
-    font = pygame.font.SysFont(None, 32)
-    score_img = font.render(f"Coins: {player.score}", True, (40,80,40))
+    score_img = text_cache.render(f"Coins: {player.score}", (40,80,40), size=32)
     screen.blit(score_img, (25,15))
 
     check_goal_and_checkpoint(player, level_manager)
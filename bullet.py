@@ -1,6 +1,20 @@
 import pygame
+import argparse
 import random
 import math
+import os
+import time
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
 
 pygame.init()
 
@@ -22,6 +36,40 @@ CYAN = (0, 255, 255)
 ORANGE = (255, 165, 0)
 level = 1
 
+USE_BULLET_STORE = numpy is not None  # False keeps one Python object per enemy bullet
+
+# Enemy and boss bullet kinds; EnemyBullet and friends below are their
+# one-object-per-bullet versions
+ENEMY, BOSS, BOUNCY, TRACKING = range(4)
+BULLET_KINDS = [
+    # (colour, radius, life, fade over, trail length)
+    (WHITE, 4, None, None, 0),
+    (RED, 4, None, None, 0),
+    ((255, 140, 0), 5, 250, 240, 30),
+    ((0, 255, 255), 6, 180, 180, 24),
+]
+TRAIL_MAX = max(kind[4] for kind in BULLET_KINDS)
+TRACKING_SPEED = 4
+TRACKING_FRAMES = 60
+ALPHA_STEPS = 32  # faded sprites are pre-rendered at this many alpha levels
+
+# Projectile limits: (off-screen margin, max age in frames, hard cap)
+PLAYER_BULLET_LIMITS = (0, 180, 200)
+ENEMY_BULLET_LIMITS = (40, 900, 4000)
+BOSS_BULLET_LIMITS = (40, 900, 20000)
+COLLISION_CELL_SIZE = 64
+EXPLOSION_LIFE = 15  # frames; the ring grows from 5 to 19 px while it fades
+EXPLOSION_CAPACITY = 256  # spawns past this many live explosions are dropped
+EXPLOSION_COLOR = (255, 100, 0)
+
+# Fixed-step simulation: speeds, cooldowns and lifetimes are all per step,
+# tuned at 60 steps a second. Rendering runs at its own rate and blends
+# between the last two steps.
+SIM_HZ = 60
+STEP_SECONDS = 1 / SIM_HZ
+MAX_CATCH_UP = 5  # steps per rendered frame; beyond this the game slows down instead
+RENDER_FPS = 120  # default; --fps overrides it
+
 stars = [{'x': random.randint(0, WIDTH), 'y': random.randint(0, HEIGHT), 'twinkle': random.uniform(0.002, 0.008), 'phase': random.uniform(0, math.pi)} for _ in range(100)]
 
 SPACE = list(SPACE_BASE)
@@ -32,14 +80,54 @@ def update_background_color():
     SPACE[2] = min(SPACE_BASE[2] + int(100 * intensity), 255)
 
 
+class SpriteCache:
+    """Pre-rendered sprites keyed by (shape, radius, colour, alpha step).
+
+    Alpha snaps to ALPHA_STEPS levels, so fading trails, glows, stars and
+    explosion rings reuse a few surfaces instead of allocating one per draw.
+    Shapes are "circle" (filled) and "ring" (a thick outline).
+    """
+    def __init__(self):
+        self.surfaces = {}
+
+    def get(self, shape, radius, color, alpha=255):
+        step = int(alpha) * (ALPHA_STEPS - 1) // 255
+        return self.get_step(shape, radius, color, max(0, min(ALPHA_STEPS - 1, step)))
+
+    def get_step(self, shape, radius, color, step):
+        key = (shape, radius, color, step)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = self.surfaces[key] = self.render(shape, radius, color, step * 255 // (ALPHA_STEPS - 1))
+        return surf
+
+    @staticmethod
+    def render(shape, radius, color, alpha):
+        size = radius * 2 + 1
+        width = max(2, radius // 3) if shape == "ring" else 0
+        if alpha >= 255:
+            # Opaque: colour-keyed blits much faster than per-pixel alpha
+            surf = pygame.Surface((size, size)).convert()
+            surf.fill(BLACK)
+            pygame.draw.circle(surf, color, (radius, radius), radius, width)
+            surf.set_colorkey(BLACK, pygame.RLEACCEL)
+            return surf
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius, width)
+        return surf.convert_alpha()
+
+sprite_cache = SpriteCache()
+
 def draw_stars(day_factor):
+    batch = []
+    ticks = pygame.time.get_ticks()
     for star in stars:
-        t = pygame.time.get_ticks() * star['twinkle'] + star['phase']
+        t = ticks * star['twinkle'] + star['phase']
         alpha = int((180 + math.sin(t) * 60) * (1 - day_factor))
         size = 1 + int((0.6 + 0.4 * math.sin(t)) > 1.1)
-        star_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(star_surf, (255, 255, 255, alpha), (2, 2), size)
-        screen.blit(star_surf, (star['x'], star['y']))
+        # Centred where a 4x4 surface blitted at (x, y) put it
+        batch.append((sprite_cache.get("circle", size, WHITE, alpha), (star['x'] + 2 - size, star['y'] + 2 - size)))
+    screen.blits(batch, doreturn=False)
 
 def check_level_change(score, bosses):
     global level
@@ -57,20 +145,61 @@ def check_level_change(score, bosses):
         bosses.append(b2)
         level = 3 
 
-explosions = []
-class Explosion:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.life = 15
+class ExplosionPool:
+    """Explosions as fixed-size x, y and life columns.
+
+    Live explosions are packed into [0, count); finished ones are refilled
+    from the end, and spawns past the capacity are dropped, so bomb spam
+    and boss deaths cost at most `capacity` ring blits a frame.
+    """
+    def __init__(self, capacity=EXPLOSION_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self.x = array('f', bytes(4 * capacity))
+        self.y = array('f', bytes(4 * capacity))
+        self.life = array('b', bytes(capacity))
+        # Ring sprite and its half size for each remaining life
+        self.sprites = [None] + [sprite_cache.get("ring", 20 - life, EXPLOSION_COLOR, 255 * life // EXPLOSION_LIFE)
+                                 for life in range(1, EXPLOSION_LIFE + 1)]
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, x, y):
+        n = self.count
+        if n == self.capacity:
+            self.dropped += 1
+            return
+        self.x[n] = x
+        self.y[n] = y
+        self.life[n] = EXPLOSION_LIFE
+        self.count = n + 1
 
     def update(self):
-        self.life -= 1
+        x, y, life = self.x, self.y, self.life
+        n = self.count
+        for i in range(n):
+            life[i] -= 1
+        i = 0
+        while i < n:
+            if life[i] <= 0:
+                n -= 1
+                x[i], y[i], life[i] = x[n], y[n], life[n]
+            else:
+                i += 1
+        self.count = n
 
     def draw(self):
-        if self.life > 0:
-            alpha = max(0, 255 * self.life // 15)
-            pygame.draw.circle(screen, (255, 100, 0, alpha), (int(self.x), int(self.y)), 20 - self.life)
+        sprites = self.sprites
+        screen.blits([(sprites[life], (int(x) - 20 + life, int(y) - 20 + life))
+                      for x, y, life in zip(self.x[:self.count], self.y[:self.count], self.life[:self.count])],
+                     doreturn=False)
+
+explosions = ExplosionPool()
 
 
 class Player:
@@ -118,9 +247,9 @@ class Player:
             enemies.clear()
             for boss in bosses:
                 boss.hit(boss_damage)
-                explosions.append(Explosion(boss.x, boss.y))
+                explosions.spawn(boss.x, boss.y)
             for i in range(18):  
-                explosions.append(Explosion(self.x + random.randint(-70, 70), self.y + random.randint(-70, 70)))
+                explosions.spawn(self.x + random.randint(-70, 70), self.y + random.randint(-70, 70))
 
     def update(self):
         if self.cooldown > 0:
@@ -135,17 +264,12 @@ class Player:
             self.bomb_cooldown -= 1
 
     def draw(self):
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = int(120 * i / self.trail_length)
-            color = (0, 255, 255, alpha)
-            trail_surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surf, color, (self.size // 2, self.size // 2), self.size // 2)
-            screen.blit(trail_surf, (tx - self.size // 2, ty - self.size // 2))
-
+        r = self.size // 2
+        batch = [(sprite_cache.get("circle", r, CYAN, 120 * i / self.trail_length), (tx - r, ty - r))
+                 for i, (tx, ty) in enumerate(self.trail)]
         glow_alpha = int(100 + 50 * math.sin(self.glow_phase))
-        glow_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (0, 255, 255, glow_alpha), (self.size, self.size), self.size)
-        screen.blit(glow_surface, (self.x - self.size, self.y - self.size))
+        batch.append((sprite_cache.get("circle", self.size, CYAN, glow_alpha), (self.x - self.size, self.y - self.size)))
+        screen.blits(batch, doreturn=False)
         color = GREEN if self.invincible % 10 < 5 else YELLOW if self.invincible > 0 else GREEN
         pygame.draw.ellipse(screen, color, (self.x - self.size // 2, self.y - self.size, self.size, self.size * 2))
         pygame.draw.circle(screen, WHITE, (self.x, self.y - self.size), 4)
@@ -198,7 +322,7 @@ class BaseEnemy:
             if dist != 0:
                 dx /= dist
                 dy /= dist
-            enemy_bullets.append(EnemyBullet(self.x, self.y, dx * 4, dy * 4))
+            enemy_bullets.emit(ENEMY, self.x, self.y, dx * 4, dy * 4)
             self.cooldown = random.randint(90, 150)
         else:
             self.cooldown -= 1
@@ -208,8 +332,123 @@ class BaseEnemy:
         pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), 5)
 
 
+# Boss bullet patterns. A pattern is a list of phases; the boss uses the
+# first phase whose "below" hp fraction it is under (None always matches)
+# and fires one of its volleys, chosen by its frame counter, every
+# "cooldown" + 1 frames. Volley types:
+#   ring    "count" bullets evenly spaced from "angle" degrees at "speed"
+#   spiral  a ring turned a further "spin" degrees on each boss volley
+#   aimed   "count" bullets fanned over "spread" degrees at the player
+#   shots   fixed (x offset, y offset, dx, dy) bullets, e.g. bouncy or tracking
+BOSS_PATTERN = [
+    {"below": 0.15, "cooldown": 18, "volleys": [
+        {"type": "shots", "kind": TRACKING, "shots": [(0, 0, 0, 0), (10, 0, 0, 0)]},
+        {"type": "shots", "kind": BOUNCY, "shots": [(-25, 12, -5, 3), (25, 12, 5, 3), (0, 18, 0, 5)]},
+    ]},
+    {"below": None, "cooldown": 27, "volleys": [
+        {"type": "ring", "kind": ENEMY, "count": 8, "speed": 3},
+        {"type": "ring", "kind": ENEMY, "count": 8, "speed": 3.5, "angle": 22},
+        {"type": "ring", "kind": ENEMY, "count": 12, "speed": 2.3},
+    ]},
+]
+# Denser stress pattern for benchmarks and forced boss phases
+DENSE_BOSS_PATTERN = [
+    {"below": 0.3, "cooldown": 4, "volleys": [
+        {"type": "spiral", "kind": BOSS, "count": 6, "speed": 3, "spin": 11.25},
+        {"type": "aimed", "kind": ENEMY, "count": 5, "speed": 4.5, "spread": 40},
+    ]},
+    {"below": None, "cooldown": 10, "volleys": [
+        {"type": "ring", "kind": ENEMY, "count": 36, "speed": 2.5},
+        {"type": "spiral", "kind": BOSS, "count": 4, "speed": 3, "spin": 7.5},
+    ]},
+]
+DIRECTION_STEPS = 1440  # pattern angles snap to quarter degrees
+UNIT_X = [math.cos(math.radians(i * 360 / DIRECTION_STEPS)) for i in range(DIRECTION_STEPS)]
+UNIT_Y = [math.sin(math.radians(i * 360 / DIRECTION_STEPS)) for i in range(DIRECTION_STEPS)]
+
+def pattern_column(values):
+    # Compiled tables go straight into BulletStore slices
+    values = tuple(values)
+    return numpy.array(values, dtype=float) if USE_BULLET_STORE else values
+
+class RingVolley:
+    """A ring, or a spiral when spin is set. Every ring it can fire is
+    looked up in the direction table once, so firing is one emit_ring."""
+    def __init__(self, kind, count, speed, angle=0, spin=0):
+        self.kind = kind
+        start = round(angle * DIRECTION_STEPS / 360)
+        turn = round(spin * DIRECTION_STEPS / 360) % DIRECTION_STEPS
+        turns = DIRECTION_STEPS // math.gcd(DIRECTION_STEPS, turn) if turn else 1
+        self.rings = []
+        for t in range(turns):
+            steps = [(start + t * turn + i * DIRECTION_STEPS // count) % DIRECTION_STEPS for i in range(count)]
+            self.rings.append((pattern_column(UNIT_X[s] * speed for s in steps),
+                               pattern_column(UNIT_Y[s] * speed for s in steps)))
+
+    def fire(self, store, x, y, target, shot):
+        dxs, dys = self.rings[shot % len(self.rings)]
+        store.emit_ring(self.kind, x, y, dxs, dys)
+
+class AimedVolley:
+    """A fan centred on the target; only the aim itself is worked out per shot."""
+    def __init__(self, kind, count, speed, spread=0):
+        self.kind = kind
+        offsets = [spread * (i / (count - 1) - 0.5) if count > 1 else 0 for i in range(count)]
+        self.cos = pattern_column(math.cos(math.radians(a)) * speed for a in offsets)
+        self.sin = pattern_column(math.sin(math.radians(a)) * speed for a in offsets)
+
+    def fire(self, store, x, y, target, shot):
+        ax = target.x - x
+        ay = target.y - y
+        dist = math.hypot(ax, ay)
+        ux, uy = (ax / dist, ay / dist) if dist else (0, 1)
+        if USE_BULLET_STORE:
+            dxs = ux * self.cos - uy * self.sin
+            dys = uy * self.cos + ux * self.sin
+        else:
+            dxs = [ux * c - uy * s for c, s in zip(self.cos, self.sin)]
+            dys = [uy * c + ux * s for c, s in zip(self.cos, self.sin)]
+        store.emit_ring(self.kind, x, y, dxs, dys)
+
+class ShotsVolley:
+    """Fixed offsets and velocities, for bouncy and tracking emitters."""
+    def __init__(self, kind, shots):
+        self.kind = kind
+        self.ox = tuple(s[0] for s in shots)
+        self.oy = tuple(s[1] for s in shots)
+        self.dx = pattern_column(s[2] for s in shots)
+        self.dy = pattern_column(s[3] for s in shots)
+
+    def fire(self, store, x, y, target, shot):
+        store.emit_many(self.kind, [x + ox for ox in self.ox], [y + oy for oy in self.oy], self.dx, self.dy)
+
+class BossPattern:
+    """A pattern definition compiled into (below, cooldown, volleys) phases."""
+    VOLLEYS = {"ring": RingVolley, "spiral": RingVolley, "aimed": AimedVolley, "shots": ShotsVolley}
+
+    def __init__(self, phases):
+        self.phases = []
+        for phase in phases:
+            volleys = []
+            for spec in phase["volleys"]:
+                spec = dict(spec)
+                volley_type = spec.pop("type")
+                if volley_type not in self.VOLLEYS:
+                    raise ValueError(f"unknown volley type {volley_type!r}")
+                volleys.append(self.VOLLEYS[volley_type](**spec))
+            self.phases.append((phase.get("below"), phase["cooldown"], volleys))
+
+    def phase(self, hp_fraction):
+        for below, cooldown, volleys in self.phases:
+            if below is None or hp_fraction < below:
+                return cooldown, volleys
+        return self.phases[-1][1:]
+
+boss_pattern = BossPattern(BOSS_PATTERN)
+
+
 class Boss:
-    def __init__(self):
+    def __init__(self, pattern=None):
         self.x = WIDTH // 2
         self.y = 90
         self.base_x = self.x
@@ -218,45 +457,20 @@ class Boss:
         self.max_hp = 70
         self.cooldown = 0
         self.pattern_phase = 0
+        self.pattern = pattern or boss_pattern
+        self.volleys_fired = 0
 
     def update(self):
         self.pattern_phase += 1
 
-        self.x = self.base_x + math.sin(pygame.time.get_ticks() / 700) * 120
-        self.y = self.base_y + math.sin(pygame.time.get_ticks() / 1400) * 20
-
-
-        enraged = self.hp < (self.max_hp * 0.15)
+        self.x = self.base_x + math.sin(sim_ticks / 700) * 120
+        self.y = self.base_y + math.sin(sim_ticks / 1400) * 20
 
         if self.cooldown == 0:
-            if enraged:
-
-                if self.pattern_phase % 2 == 0:
-         
-                    boss_bullets.append(BossTrackingBullet(self.x, self.y))
-                    boss_bullets.append(BossTrackingBullet(self.x + 10, self.y))
-                else:
-
-                    boss_bullets.append(BossBouncyBullet(self.x - 25, self.y + 12, -5, 3))
-                    boss_bullets.append(BossBouncyBullet(self.x + 25, self.y + 12, 5, 3))
-                    boss_bullets.append(BossBouncyBullet(self.x, self.y + 18, 0, 5))
-                self.cooldown = 18  
-            else:
-
-                pattern = self.pattern_phase % 3
-                if pattern == 0:
-                    for angle in range(0, 360, 45):
-                        rad = math.radians(angle)
-                        boss_bullets.append(EnemyBullet(self.x, self.y, math.cos(rad) * 3, math.sin(rad) * 3))
-                elif pattern == 1:
-                    for angle in range(22, 382, 45):  
-                        rad = math.radians(angle)
-                        boss_bullets.append(EnemyBullet(self.x, self.y, math.cos(rad) * 3.5, math.sin(rad) * 3.5))
-                else:
-                    for angle in range(0, 360, 30):
-                        rad = math.radians(angle)
-                        boss_bullets.append(EnemyBullet(self.x, self.y, math.cos(rad) * 2.3, math.sin(rad) * 2.3))
-                self.cooldown = 27
+            cooldown, volleys = self.pattern.phase(self.hp / self.max_hp)
+            volleys[self.pattern_phase % len(volleys)].fire(boss_bullets, self.x, self.y, player, self.volleys_fired)
+            self.volleys_fired += 1
+            self.cooldown = cooldown
         else:
             self.cooldown -= 1
 
@@ -277,7 +491,7 @@ class Boss:
 
 
 def enemy_hit(enemy):
-    explosions.append(Explosion(enemy.x, enemy.y))
+    explosions.spawn(enemy.x, enemy.y)
 
 class BossBullet:
     def __init__(self, x, y, dx, dy):
@@ -317,20 +531,13 @@ class BossBouncyBullet(EnemyBullet):
             self.trail.pop(0)
 
     def draw(self):
-        fade = max(0, int(255 * self.life / self.max_life))
-
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = int(fade * i / len(self.trail)) if self.trail else 0
-            trail_surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-
-            pygame.draw.circle(trail_surf, (255, 140, 0), (self.radius, self.radius), self.radius)
-            trail_surf.set_alpha(alpha)
-            screen.blit(trail_surf, (tx - self.radius, ty - self.radius))
-
-        bouncy_surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(bouncy_surf, (255, 140, 0), (self.radius, self.radius), self.radius)
-        bouncy_surf.set_alpha(fade)
-        screen.blit(bouncy_surf, (self.x - self.radius, self.y - self.radius))
+        fade = max(0, min(255, int(255 * self.life / self.max_life)))
+        r = self.radius
+        color = (255, 140, 0)
+        batch = [(sprite_cache.get("circle", r, color, fade * i / len(self.trail)), (tx - r, ty - r))
+                 for i, (tx, ty) in enumerate(self.trail)]
+        batch.append((sprite_cache.get("circle", r, color, fade), (self.x - r, self.y - r)))
+        screen.blits(batch, doreturn=False)
 
 
 
@@ -363,14 +570,407 @@ class BossTrackingBullet(EnemyBullet):
 
     def draw(self):
         fade = max(0, int(255 * self.life / 180))
-        for i, (tx, ty) in enumerate(self.trail):
-            alpha = int(fade * i / len(self.trail)) if self.trail else 0
-            trail_surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surf, (0, 255, 255, alpha), (self.radius, self.radius), self.radius)
-            screen.blit(trail_surf, (tx - self.radius, ty - self.radius))
-        bullet_surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-        pygame.draw.circle(bullet_surf, (0, 255, 255, fade), (self.radius, self.radius), self.radius)
-        screen.blit(bullet_surf, (self.x - self.radius, self.y - self.radius))
+        r = self.radius
+        batch = [(sprite_cache.get("circle", r, CYAN, fade * i / len(self.trail)), (tx - r, ty - r))
+                 for i, (tx, ty) in enumerate(self.trail)]
+        batch.append((sprite_cache.get("circle", r, CYAN, fade), (self.x - r, self.y - r)))
+        screen.blits(batch, doreturn=False)
+
+class Interpolator:
+    """Positions as of the start of the last step, so frames drawn between
+    steps can blend from them toward the current state."""
+    def __init__(self):
+        self.prev = {}
+
+    def capture(self, *groups):
+        self.prev = {item: (item.x, item.y) for group in groups for item in group}
+
+    def draw(self, items, alpha):
+        for item in items:
+            x, y = item.x, item.y
+            px, py = self.prev.get(item, (x, y))
+            item.x = px + (x - px) * alpha
+            item.y = py + (y - py) * alpha
+            item.draw()
+            item.x, item.y = x, y
+
+class BulletList:
+    """Enemy bullets as one Python object each, for when numpy is missing.
+
+    Same interface as BulletStore: emit by kind, then update, draw,
+    hit_player and expire once per frame.
+    """
+    def __init__(self):
+        self.items = []
+        self.motion = Interpolator()
+
+    def __len__(self):
+        return len(self.items)
+
+    def clear(self):
+        self.items.clear()
+
+    def emit(self, kind, x, y, dx=0, dy=0):
+        if kind == TRACKING:
+            self.items.append(BossTrackingBullet(x, y))
+        else:
+            cls = (EnemyBullet, BossBullet, BossBouncyBullet)[kind]
+            self.items.append(cls(x, y, dx, dy))
+
+    def emit_many(self, kind, xs, ys, dxs, dys):
+        for x, y, dx, dy in zip(xs, ys, dxs, dys):
+            self.emit(kind, x, y, dx, dy)
+
+    def emit_ring(self, kind, x, y, dxs, dys):
+        for dx, dy in zip(dxs, dys):
+            self.emit(kind, x, y, dx, dy)
+
+    def update(self, px, py):
+        self.motion.capture(self.items)
+        for b in self.items:
+            b.update()
+
+    def draw(self, alpha=1.0):
+        self.motion.draw(self.items, alpha)
+
+    def hit_player(self, px, py, reach):
+        # Removes the first bullet within reach; True if there was one
+        for b in self.items:
+            if abs(b.x - px) < reach and abs(b.y - py) < reach:
+                self.items.remove(b)
+                return True
+        return False
+
+    def expire(self):
+        self.items[:] = [b for b in self.items if getattr(b, 'life', 1) > 0]
+
+    def enforce(self, margin, max_age, cap, frame):
+        return limit_objects(self.items, margin, max_age, cap, frame)
+
+
+class BulletStore:
+    """Struct-of-arrays home for enemy and boss bullets.
+
+    Positions (now and before the last step, for interpolated drawing),
+    velocities, lives, ages, kinds, tracking timers and trails are NumPy
+    columns with the live bullets packed into rows [0, count). Each step
+    is a handful of whole-array passes; removed rows are refilled by
+    swapping in live rows from the end.
+    """
+    def __init__(self, capacity=1024):
+        if numpy is None:
+            raise RuntimeError("BulletStore requires numpy")
+        self.count = 0
+        self.capacity = 0
+        self.x = self.y = self.px = self.py = self.dx = self.dy = self.life = numpy.zeros(0)
+        self.age = numpy.zeros(0, dtype=numpy.int32)
+        self.track = numpy.zeros(0, dtype=numpy.int16)
+        self.kind = numpy.zeros(0, dtype=numpy.int8)
+        self.trail = numpy.zeros((0, TRAIL_MAX, 2), dtype=numpy.float32)
+        self.trail_len = numpy.zeros(0, dtype=numpy.int16)
+        self.trail_at = numpy.zeros(0, dtype=numpy.int16)
+        self.reserve(capacity)
+        # Per-kind lookups, indexed by the kind column
+        self.kind_radius = numpy.array([k[1] for k in BULLET_KINDS])
+        self.kind_life = numpy.array([k[2] or numpy.inf for k in BULLET_KINDS], dtype=float)
+        self.kind_fade = numpy.array([k[3] or 0 for k in BULLET_KINDS], dtype=float)
+        self.kind_trail = numpy.array([k[4] for k in BULLET_KINDS], dtype=numpy.int16)
+        self.sprites = [sprite_cache.get_step("circle", radius, color, step)
+                        for color, radius, _, _, _ in BULLET_KINDS for step in range(ALPHA_STEPS)]
+
+    COLUMNS = ("x", "y", "px", "py", "dx", "dy", "life", "age", "track", "kind", "trail", "trail_len", "trail_at")
+
+    def __len__(self):
+        return self.count
+
+    def reserve(self, capacity):
+        if capacity <= self.capacity:
+            return
+        n = self.count
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = numpy.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, kind, x, y, dx=0, dy=0):
+        self.emit_many(kind, (x,), (y,), (dx,), (dy,))
+
+    def emit_ring(self, kind, x, y, dxs, dys):
+        # Every bullet from one point; x and y fill their slices
+        self.emit_many(kind, x, y, dxs, dys)
+
+    def emit_many(self, kind, xs, ys, dxs, dys):
+        k = len(dxs)
+        if not k:
+            return
+        n = self.count
+        if n + k > self.capacity:
+            self.reserve(max(2 * self.capacity, n + k))
+        self.x[n:n + k] = xs
+        self.y[n:n + k] = ys
+        self.px[n:n + k] = xs
+        self.py[n:n + k] = ys
+        self.dx[n:n + k] = dxs
+        self.dy[n:n + k] = dys
+        self.life[n:n + k] = self.kind_life[kind]
+        self.age[n:n + k] = 0
+        self.track[n:n + k] = TRACKING_FRAMES if kind == TRACKING else 0
+        self.kind[n:n + k] = kind
+        self.trail_len[n:n + k] = 0
+        self.trail_at[n:n + k] = 0
+        self.count = n + k
+
+    def update(self, px, py):
+        n = self.count
+        if not n:
+            return
+        x, y, dx, dy = self.x[:n], self.y[:n], self.dx[:n], self.dy[:n]
+        self.px[:n] = x
+        self.py[:n] = y
+        kind = self.kind[:n]
+        # Tracking bullets steer at the player while their timer runs
+        track = self.track[:n]
+        steer = numpy.flatnonzero(track > 0)
+        if len(steer):
+            tx, ty = px - x[steer], py - y[steer]
+            dist = numpy.hypot(tx, ty)
+            dist[dist == 0] = 1
+            dx[steer] = tx / dist * TRACKING_SPEED
+            dy[steer] = ty / dist * TRACKING_SPEED
+            track[steer] -= 1
+        x += dx
+        y += dy
+        bouncy = kind == BOUNCY
+        if bouncy.any():
+            dx[bouncy & ((x < 0) | (x > WIDTH))] *= -1
+            dy[bouncy & ((y < 0) | (y > HEIGHT))] *= -1
+        self.life[:n] -= 1
+        self.age[:n] += 1
+        trailed = numpy.flatnonzero(self.kind_trail[kind] > 0)
+        if len(trailed):
+            at = self.trail_at[trailed]
+            self.trail[trailed, at, 0] = x[trailed]
+            self.trail[trailed, at, 1] = y[trailed]
+            size = self.kind_trail[kind[trailed]]
+            self.trail_at[trailed] = (at + 1) % size
+            self.trail_len[trailed] = numpy.minimum(self.trail_len[trailed] + 1, size)
+
+    def remove(self, rows):
+        # rows: sorted, unique live row numbers
+        k = len(rows)
+        if not k:
+            return
+        n = self.count
+        m = n - k
+        dead = numpy.zeros(n, dtype=bool)
+        dead[rows] = True
+        holes = rows[rows < m]
+        movers = numpy.flatnonzero(~dead[m:]) + m
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[holes] = column[movers]
+        self.count = m
+
+    def hit_player(self, px, py, reach):
+        n = self.count
+        hits = numpy.flatnonzero((numpy.abs(self.x[:n] - px) < reach) & (numpy.abs(self.y[:n] - py) < reach))
+        if not len(hits):
+            return False
+        self.remove(hits[:1])
+        return True
+
+    def expire(self):
+        self.remove(numpy.flatnonzero(self.life[:self.count] <= 0))
+
+    def enforce(self, margin, max_age, cap, frame):
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        out = (x < -margin) | (x > WIDTH + margin) | (y < -margin) | (y > HEIGHT + margin)
+        dead = out
+        aged = 0
+        if max_age is not None:
+            old = (self.age[:n] > max_age) & ~out
+            aged = int(old.sum())
+            dead = out | old
+        culled = int(out.sum())
+        self.remove(numpy.flatnonzero(dead))
+        capped = 0
+        if cap is not None and self.count > cap:
+            n = self.count
+            capped = n - cap
+            oldest = numpy.argpartition(-self.age[:n], capped - 1)[:capped]
+            self.remove(numpy.sort(oldest))
+        return culled, aged, capped
+
+    def fade_steps(self, n):
+        # Alpha step per live bullet: full for unfaded kinds, else life / fade time
+        kind = self.kind[:n]
+        fade_over = self.kind_fade[kind]
+        fade = numpy.where(fade_over > 0, 255 * self.life[:n] / numpy.maximum(fade_over, 1), 255)
+        return numpy.clip(fade, 0, 255)
+
+    def draw(self, alpha=1.0):
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1:
+            x = self.px[:n] + (x - self.px[:n]) * alpha
+            y = self.py[:n] + (y - self.py[:n]) * alpha
+        kind = self.kind[:n]
+        fade = self.fade_steps(n)
+        base = kind.astype(numpy.intp) * ALPHA_STEPS
+        radius = self.kind_radius[kind]
+        sprites = self.sprites
+        batch = []
+        # Trails first, oldest point faintest: alpha = fade * i / len
+        trailed = numpy.flatnonzero(self.trail_len[:n] > 0)
+        if len(trailed):
+            length = self.trail_len[trailed].astype(numpy.intp)
+            size = self.kind_trail[kind[trailed]].astype(numpy.intp)
+            i = numpy.arange(TRAIL_MAX)
+            order = (self.trail_at[trailed, None] - length[:, None] + i) % size[:, None]
+            alpha = (fade[trailed, None] * i / length[:, None]).astype(int)
+            shown = (i < length[:, None]) & (alpha > 0)
+            rows = numpy.broadcast_to(trailed[:, None], order.shape)[shown]
+            points = self.trail[rows, order[shown]]
+            codes = base[rows] + alpha[shown] * (ALPHA_STEPS - 1) // 255
+            r = radius[rows]
+            batch.extend(zip([sprites[c] for c in codes.tolist()],
+                             zip((points[:, 0] - r).astype(int).tolist(), (points[:, 1] - r).astype(int).tolist())))
+        codes = base + fade.astype(int) * (ALPHA_STEPS - 1) // 255
+        batch.extend(zip([sprites[c] for c in codes.tolist()],
+                         zip((x - radius).astype(int).tolist(), (y - radius).astype(int).tolist())))
+        screen.blits(batch, doreturn=False)
+
+
+def limit_objects(items, margin, max_age, cap, frame):
+    # In-place bounds, age and cap pass over a list of projectile objects.
+    # Ages count from the first sweep that saw the object.
+    culled = aged = 0
+    kept = []
+    for b in items:
+        born = getattr(b, 'born', None)
+        if born is None:
+            b.born = born = frame
+        if b.x < -margin or b.x > WIDTH + margin or b.y < -margin or b.y > HEIGHT + margin:
+            culled += 1
+        elif max_age is not None and frame - born > max_age:
+            aged += 1
+        else:
+            kept.append(b)
+    capped = 0
+    if cap is not None and len(kept) > cap:
+        # Lists only ever grow by append, so the front is the oldest
+        capped = len(kept) - cap
+        del kept[:capped]
+    items[:] = kept
+    return culled, aged, capped
+
+
+class CollisionGrid:
+    """Uniform-grid broad phase over the player's shots, rebuilt every frame.
+
+    Each shot goes into the one cell holding its centre, tagged with its
+    position in the bullets list. A target's box query only looks at the
+    cells that box overlaps and runs the exact abs(dx)/abs(dy) test on
+    those shots, picking the earliest-fired one as the old nested loops
+    did.
+    """
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, items):
+        cells = self.cells
+        cells.clear()
+        size = self.cell_size
+        for order, item in enumerate(items):
+            key = (int(item.x // size), int(item.y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                bucket = cells[key] = []
+            bucket.append((order, item))
+
+    def near(self, x0, y0, x1, y1):
+        size = self.cell_size
+        cells = self.cells
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def first_hit(self, x, y, reach_x, reach_y, spent=()):
+        best_order, best = None, None
+        for order, item in self.near(x - reach_x, y - reach_y, x + reach_x, y + reach_y):
+            if (best_order is None or order < best_order) and item not in spent \
+                    and abs(x - item.x) < reach_x and abs(y - item.y) < reach_y:
+                best_order, best = order, item
+        return best
+
+
+class ProjectileLifetimes:
+    """Keeps every projectile container bounded, once per frame.
+
+    Each registered container gets off-screen culling past a margin, an
+    optional maximum age in frames and an optional hard cap (oldest go
+    first). Live, peak and removal counts are kept per container for the
+    debug overlay and soak runs.
+    """
+    def __init__(self):
+        self.entries = []
+        self.frame = 0
+
+    def register(self, name, container, margin=40, max_age=None, cap=None):
+        self.entries.append({'name': name, 'container': container, 'margin': margin, 'max_age': max_age,
+                             'cap': cap, 'live': 0, 'peak': 0, 'culled': 0, 'aged': 0, 'capped': 0})
+
+    def sweep(self):
+        self.frame += 1
+        for entry in self.entries:
+            container = entry['container']
+            limits = (entry['margin'], entry['max_age'], entry['cap'], self.frame)
+            if isinstance(container, list):
+                culled, aged, capped = limit_objects(container, *limits)
+            else:
+                culled, aged, capped = container.enforce(*limits)
+            entry['culled'] += culled
+            entry['aged'] += aged
+            entry['capped'] += capped
+            entry['live'] = len(container)
+            entry['peak'] = max(entry['peak'], entry['live'])
+
+    def cull(self, container):
+        # Off-screen pass for one list ahead of the sweep, counted in its stats
+        for entry in self.entries:
+            if entry['container'] is container:
+                culled, _, _ = limit_objects(container, entry['margin'], None, None, self.frame + 1)
+                entry['culled'] += culled
+
+    def counts(self):
+        return {entry['name']: entry['live'] for entry in self.entries}
+
+    def draw_overlay(self, surface, overlay_font, frame_ms):
+        lines = [f"frame {frame_ms:5.1f} ms  fps {clock.get_fps():5.1f}"]
+        if resource is not None:
+            lines.append(f"peak rss {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024} MiB")
+        for e in self.entries:
+            lines.append(f"{e['name']:<14} live {e['live']:5d} peak {e['peak']:5d}  "
+                         f"culled {e['culled']} aged {e['aged']} capped {e['capped']}")
+        y = HEIGHT - 10 - 18 * len(lines)
+        for line in lines:
+            surface.blit(overlay_font.render(line, True, WHITE), (10, y))
+            y += 18
+
+
+def make_enemy_bullets():
+    return BulletStore() if USE_BULLET_STORE else BulletList()
 
 class BouncyEnemy(BaseEnemy):
     def __init__(self):
@@ -392,7 +992,7 @@ class TrackingEnemy(BaseEnemy):
         self.x += math.cos(angle) * self.speed
         self.y += math.sin(angle) * self.speed
         if self.cooldown == 0:
-            enemy_bullets.append(EnemyBullet(self.x, self.y, math.cos(angle) * 4, math.sin(angle) * 4))
+            enemy_bullets.emit(ENEMY, self.x, self.y, math.cos(angle) * 4, math.sin(angle) * 4)
             self.cooldown = random.randint(100, 140)
         else:
             self.cooldown -= 1
@@ -401,24 +1001,132 @@ player = Player()
 bullets = []
 enemies = []
 boss = None
-boss_bullets = []
-enemy_bullets = []
+boss_bullets = make_enemy_bullets()
+enemy_bullets = make_enemy_bullets()
 score = 0
+sim_ticks = 0.0  # simulated milliseconds; boss movement follows this, not the wall clock
 font = pygame.font.SysFont(None, 36)
+debug_font = pygame.font.SysFont(None, 20)
+lifetimes = ProjectileLifetimes()
+lifetimes.register("player bullets", bullets, *PLAYER_BULLET_LIMITS)
+lifetimes.register("enemy bullets", enemy_bullets, *ENEMY_BULLET_LIMITS)
+lifetimes.register("boss bullets", boss_bullets, *BOSS_BULLET_LIMITS)
+debug_overlay = False
+shots = CollisionGrid()
+
+def benchmark_bullets(frames=120):
+    # Steady dense boss pattern: every frame update, cull and draw, then top
+    # the field back up to the target count; 1% of bullets leave trails
+    rng = random.Random(1)
+    backends = [("objects", BulletList)] + ([("store", BulletStore)] if numpy is not None else [])
+    for count in (1000, 5000, 20000):
+        for name, backend in backends:
+            if backend is BulletList and count > 5000:
+                continue
+            store = backend()
+            step_time = draw_time = 0.0
+            for frame in range(frames):
+                missing = count - len(store)
+                trailed = missing // 100
+                for kind, k in ((ENEMY, missing - missing // 2 - trailed), (BOSS, missing // 2),
+                                (BOUNCY, trailed - trailed // 2), (TRACKING, trailed // 2)):
+                    angles = [rng.uniform(0, 2 * math.pi) for _ in range(k)]
+                    store.emit_many(kind, [rng.uniform(0, WIDTH) for _ in angles], [rng.uniform(0, HEIGHT) for _ in angles],
+                                    [math.cos(a) * 2 for a in angles], [math.sin(a) * 2 for a in angles])
+                t0 = time.perf_counter()
+                store.update(player.x, player.y)
+                store.hit_player(player.x, player.y, 10)
+                store.expire()
+                store.enforce(*BOSS_BULLET_LIMITS, frame)
+                t1 = time.perf_counter()
+                screen.fill(SPACE)
+                store.draw()
+                t2 = time.perf_counter()
+                step_time += t1 - t0
+                draw_time += t2 - t1
+            print(f"{count:6d} bullets {name:>7}: update {step_time / frames * 1000:7.2f} ms  "
+                  f"draw {draw_time / frames * 1000:7.2f} ms  per frame")
+
+def benchmark_collisions():
+    # Player shots vs enemies, half of each, at the density of 1000 entities
+    # per screen (the field grows with the count): the old nested loops
+    # against the grid broad phase, with matching hit lists
+    class Target:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+    for count in (10, 100, 1000, 10000):
+        rng = random.Random(count)
+        scale = math.sqrt(count / 1000)
+        w, h = WIDTH * scale, HEIGHT * scale
+        shot_list = [Bullet(rng.uniform(0, w), rng.uniform(0, h), -8, YELLOW) for _ in range(count // 2)]
+        targets = [Target(rng.uniform(0, w), rng.uniform(0, h)) for _ in range(count - count // 2)]
+        t0 = time.perf_counter()
+        remaining = shot_list[:]
+        naive = []
+        for target in targets:
+            for bullet in remaining[:]:
+                if abs(target.x - bullet.x) < 20 and abs(target.y - bullet.y) < 20:
+                    remaining.remove(bullet)
+                    naive.append(bullet)
+                    break
+            else:
+                naive.append(None)
+        t1 = time.perf_counter()
+        grid = CollisionGrid()
+        grid.rebuild(shot_list)
+        spent = set()
+        hashed = []
+        for target in targets:
+            bullet = grid.first_hit(target.x, target.y, 20, 20, spent)
+            if bullet is not None:
+                spent.add(bullet)
+            hashed.append(bullet)
+        t2 = time.perf_counter()
+        print(f"{count:6d} entities: nested loops {(t1 - t0) * 1000:9.2f} ms  grid {(t2 - t1) * 1000:7.2f} ms  "
+              f"hits {sum(b is not None for b in hashed)}  match {naive == hashed}")
+
+def benchmark_patterns(volleys=20000):
+    # Emission throughput: rings built per bullet with radians/cos/sin and
+    # single emits (the old Boss.update) against compiled volleys
+    target = Player()
+    store = make_enemy_bullets()
+    def per_bullet(count, speed):
+        def fire(store, x, y, target, shot):
+            for angle in range(0, 360, 360 // count):
+                rad = math.radians(angle)
+                store.emit(ENEMY, x, y, math.cos(rad) * speed, math.sin(rad) * speed)
+        return fire
+    cases = [("ring 12 per bullet", per_bullet(12, 2.3)),
+             ("ring 36 per bullet", per_bullet(36, 2.5))]
+    for pattern in (BOSS_PATTERN, DENSE_BOSS_PATTERN):
+        for phase in pattern:
+            for spec in phase["volleys"]:
+                volley = BossPattern([{"cooldown": 0, "volleys": [spec]}]).phases[0][2][0]
+                label = f"{spec['type']} {spec.get('count', len(spec.get('shots', ())))}"
+                cases.append((label, volley.fire))
+    for label, fire in cases:
+        emitted = 0
+        t0 = time.perf_counter()
+        for shot in range(volleys):
+            fire(store, 400, 90, target, shot)
+            if len(store) > 5000:
+                emitted += len(store)
+                store.clear()
+        emitted += len(store)
+        store.clear()
+        elapsed = time.perf_counter() - t0
+        print(f"{label:<20} {volleys / elapsed / 1000:8.1f} k volleys/s  {emitted / elapsed / 1e6:6.2f} M bullets/s")
 
 running = True
 bosses = []
 score = 0
+motion = Interpolator()
 
-while running:
-    update_background_color()
-    screen.fill(SPACE)
-    draw_stars(0)
-    keys = pygame.key.get_pressed()
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+def step(keys):
+    # One fixed simulation step: input, spawns, movement, collisions, lifetimes
+    global score, running, sim_ticks
+    sim_ticks += STEP_SECONDS * 1000
+    motion.capture((player,), bullets, bosses, enemies)
 
     if keys[pygame.K_SPACE]:
         player.shoot()
@@ -427,78 +1135,80 @@ while running:
 
     player.move(keys)
     player.update()
-    player.draw()
 
-    for bullet in bullets[:]:
+    for bullet in bullets:
         bullet.update()
-        if bullet.y < 0:
-            bullets.remove(bullet)
-        else:
-            bullet.draw()
+    # Shots past the top edge are gone before they can hit anything up there
+    lifetimes.cull(bullets)
 
     if not bosses and level == 1:
         if random.random() < 0.02:
             enemy_type = random.choice([BaseEnemy, BouncyEnemy, TrackingEnemy])
             enemies.append(enemy_type())
 
+    shots.rebuild(bullets)
+    spent = set()
     for boss in bosses[:]:
         boss.update()
-        boss.draw()
-        for bullet in bullets[:]:
-            if abs(boss.x - bullet.x) < 40 and abs(boss.y - bullet.y) < 20:
-                boss.hit(1)
-                explosions.append(Explosion(boss.x, boss.y))
-                bullets.remove(bullet)
-                if boss.hp <= 0:
-                    # Mega explosion on death
-                    for _ in range(12):
-                        ex = Explosion(boss.x + random.randint(-32, 32), boss.y + random.randint(-18,18))
-                        explosions.append(ex)
-                    bosses.remove(boss)
-                break
+        bullet = shots.first_hit(boss.x, boss.y, 40, 20, spent)
+        if bullet is not None:
+            boss.hit(1)
+            explosions.spawn(boss.x, boss.y)
+            spent.add(bullet)
+            if boss.hp <= 0:
+                # Mega explosion on death
+                for _ in range(12):
+                    explosions.spawn(boss.x + random.randint(-32, 32), boss.y + random.randint(-18, 18))
+                bosses.remove(boss)
 
     check_level_change(score, bosses)
 
-    for enemy in enemies[:]:
+    gone = set()
+    for enemy in enemies:
         enemy.update()
-        enemy.draw()
         if enemy.y > HEIGHT:
-            enemies.remove(enemy)
+            gone.add(enemy)
             continue
-        for bullet in bullets[:]:
-            if abs(enemy.x - bullet.x) < 20 and abs(enemy.y - bullet.y) < 20:
-                explosions.append(Explosion(enemy.x, enemy.y))
-                enemies.remove(enemy)
-                bullets.remove(bullet)
-                score += 1
-                break
-
-    for b in boss_bullets[:]:
-        b.update()
-        b.draw()
-        remove_bullet = False
-        if abs(b.x - player.x) < 10 and abs(b.y - player.y) < 10 and player.invincible == 0:
-            player.hp -= 1
-            player.invincible = 60
-            remove_bullet = True
-        if hasattr(b, 'life') and b.life <= 0:
-            remove_bullet = True
-        elif (b.x < -40 or b.x > WIDTH + 40 or b.y < -40 or b.y > HEIGHT + 40):
-            remove_bullet = True
-        if remove_bullet:
-            boss_bullets.remove(b)
-
-    for b in enemy_bullets[:]:
-        b.update()
-        b.draw()
-        if abs(b.x - player.x) < 10 and abs(b.y - player.y) < 10 and player.invincible == 0:
-            player.hp -= 1
-            player.invincible = 60
-            enemy_bullets.remove(b)
+        bullet = shots.first_hit(enemy.x, enemy.y, 20, 20, spent)
+        if bullet is not None:
+            explosions.spawn(enemy.x, enemy.y)
+            gone.add(enemy)
+            spent.add(bullet)
+            score += 1
+    if gone:
+        enemies[:] = [e for e in enemies if e not in gone]
+    if spent:
+        bullets[:] = [b for b in bullets if b not in spent]
+
+    boss_bullets.update(player.x, player.y)
+    if player.invincible == 0 and boss_bullets.hit_player(player.x, player.y, 10):
+        player.hp -= 1
+        player.invincible = 60
+    boss_bullets.expire()
+
+    enemy_bullets.update(player.x, player.y)
+    if player.invincible == 0 and enemy_bullets.hit_player(player.x, player.y, 10):
+        player.hp -= 1
+        player.invincible = 60
+    lifetimes.sweep()
+
+    explosions.update()
 
     if player.hp <= 0:
         running = False
 
+def render(alpha):
+    # Draw the world blended alpha of the way from the previous step to the current one
+    update_background_color()
+    screen.fill(SPACE)
+    draw_stars(0)
+
+    motion.draw((player,), alpha)
+    motion.draw(bullets, alpha)
+    motion.draw(bosses, alpha)
+    motion.draw(enemies, alpha)
+    boss_bullets.draw(alpha)
+    enemy_bullets.draw(alpha)
 
     for i in range(player.hp):
         pygame.draw.rect(screen, GREEN, (WIDTH - 30 * (i + 1), 10, 20, 20))
@@ -511,13 +1221,82 @@ while running:
     bomb_text = font.render(f"Bombs: {player.bombs}", True, CYAN)
     screen.blit(bomb_text, (WIDTH - 120, 40))
 
-    for explosion in explosions[:]:
-        explosion.update()
-        explosion.draw()
-        if explosion.life <= 0:
-            explosions.remove(explosion)
-
-    pygame.display.flip()
-    clock.tick(60)
-
-pygame.quit()
+    explosions.draw()
+
+def new_game(seed=None):
+    """Reset to the start of level 1; a seed makes the run repeatable."""
+    global player, score, level, sim_ticks, running
+    if seed is not None:
+        random.seed(seed)
+    player = Player()
+    for items in (bullets, enemies, bosses, explosions, boss_bullets, enemy_bullets):
+        items.clear()
+    score = 0
+    level = 1
+    sim_ticks = 0.0
+    running = True
+    explosions.dropped = 0
+    lifetimes.frame = 0
+    for entry in lifetimes.entries:
+        entry.update(live=0, peak=0, culled=0, aged=0, capped=0)
+
+def main(argv=None):
+    global running, debug_overlay, screen
+    parser = argparse.ArgumentParser(description="Bullet Hell Space Game")
+    parser.add_argument("--fps", type=int, default=RENDER_FPS,
+                        help=f"rendered frames per second; the simulation always steps at {SIM_HZ} Hz")
+    parser.add_argument("--debug", action="store_true", help="start with the projectile overlay on (F3 toggles it)")
+    bench = parser.add_mutually_exclusive_group()
+    bench.add_argument("--bench-patterns", action="store_true", help="time compiled boss volleys against per-bullet trig")
+    bench.add_argument("--bench-collide", action="store_true", help="time the shot collision broad phase")
+    bench.add_argument("--bench-bullets", action="store_true", help="time enemy bullet update and draw per backend")
+    args = parser.parse_args(argv)
+    debug_overlay = args.debug
+
+    if args.bench_patterns or args.bench_collide or args.bench_bullets:
+        # Benchmarks run without a window
+        pygame.display.quit()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        if args.bench_patterns:
+            benchmark_patterns()
+        elif args.bench_collide:
+            benchmark_collisions()
+        else:
+            benchmark_bullets()
+        return
+
+    accumulator = 0.0
+    last_time = time.perf_counter()
+    while running:
+        frame_start = time.perf_counter()
+        accumulator += frame_start - last_time
+        last_time = frame_start
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                debug_overlay = not debug_overlay
+        keys = pygame.key.get_pressed()
+
+        steps = 0
+        while accumulator >= STEP_SECONDS and steps < MAX_CATCH_UP and running:
+            step(keys)
+            accumulator -= STEP_SECONDS
+            steps += 1
+        if steps == MAX_CATCH_UP:
+            # Too far behind to catch up: drop the backlog rather than spiral
+            accumulator = min(accumulator, STEP_SECONDS)
+
+        render(accumulator / STEP_SECONDS)
+        if debug_overlay:
+            lifetimes.draw_overlay(screen, debug_font, (time.perf_counter() - frame_start) * 1000)
+        pygame.display.flip()
+        clock.tick(args.fps)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
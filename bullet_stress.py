@@ -0,0 +1,147 @@
+"""Headless stress run for bullet.py: forced boss phases, scripted player.
+
+Steps the game with a seeded RNG, renders every step to a dummy display
+and prints a JSON report: updates/s, step and draw times, allocation
+counts and peak live projectiles. Exits non-zero when any frame (step +
+draw) goes over the budget, so new patterns can be checked locally.
+
+    python bullet_stress.py [--steps 1800] [--seed 1] [--player random]
+        [--pattern dense] [--bosses 2] [--hp 0.1] [--budget-ms 16]
+        [--out report.json]
+"""
+import argparse
+import collections
+import gc
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import bullet
+
+PATTERNS = {"default": bullet.BOSS_PATTERN, "dense": bullet.DENSE_BOSS_PATTERN}
+MOVES = {"left": (pygame.K_LEFT,), "right": (pygame.K_RIGHT,), "up": (pygame.K_UP,), "down": (pygame.K_DOWN,),
+         "up-left": (pygame.K_UP, pygame.K_LEFT), "up-right": (pygame.K_UP, pygame.K_RIGHT),
+         "down-left": (pygame.K_DOWN, pygame.K_LEFT), "down-right": (pygame.K_DOWN, pygame.K_RIGHT),
+         "still": ()}
+
+
+def player_keys(mode, rng):
+    """Yield one key state per step; the player always holds fire."""
+    held = ()
+    for frame in range(sys.maxsize):
+        if mode == "sweep":
+            held = MOVES["left" if frame // 90 % 2 else "right"]
+        elif mode == "random" and frame % 15 == 0:
+            held = MOVES[rng.choice(sorted(MOVES))]
+        keys = collections.defaultdict(bool)
+        keys[pygame.K_SPACE] = True
+        for key in held:
+            keys[key] = True
+        yield keys
+
+
+def spawn_bosses(count, pattern):
+    bullet.level = 2  # no enemy waves and no further bosses
+    for i in range(count):
+        boss = bullet.Boss(pattern)
+        boss.base_x = boss.x = bullet.WIDTH * (i + 1) // (count + 1)
+        bullet.bosses.append(boss)
+
+
+def summary(times):
+    times = sorted(times)
+    n = len(times)
+    return {"mean": round(sum(times) / n, 3), "p99": round(times[int(0.99 * (n - 1))], 3),
+            "max": round(times[-1], 3)}
+
+
+def run(args):
+    bullet.new_game(args.seed)
+    pattern = bullet.BossPattern(PATTERNS[args.pattern])
+    spawn_bosses(args.bosses, pattern)
+    keys = player_keys(args.player, random.Random(args.seed + 1))
+    step_ms, draw_ms, frame_ms = [], [], []
+    hits = 0
+    peak_explosions = 0
+    gc_before = blocks_before = sprites_before = 0
+    for frame in range(args.warmup + args.steps):
+        if frame == args.warmup:
+            gc_before = sum(stat["collections"] for stat in gc.get_stats())
+            blocks_before = sys.getallocatedblocks()
+            sprites_before = len(bullet.sprite_cache.surfaces)
+        for boss in bullet.bosses:
+            boss.hp = boss.max_hp * args.hp  # pins the phase
+        t0 = time.perf_counter()
+        bullet.step(next(keys))
+        t1 = time.perf_counter()
+        bullet.render(1.0)
+        pygame.display.flip()
+        t2 = time.perf_counter()
+        if bullet.player.hp < 3:
+            hits += 3 - bullet.player.hp
+            bullet.player.hp = 3
+        bullet.running = True
+        if frame >= args.warmup:
+            step_ms.append((t1 - t0) * 1000)
+            draw_ms.append((t2 - t1) * 1000)
+            frame_ms.append((t2 - t0) * 1000)
+            peak_explosions = max(peak_explosions, len(bullet.explosions))
+    over = sum(ms > args.budget_ms for ms in frame_ms)
+    return {
+        "seed": args.seed,
+        "steps": args.steps,
+        "player": args.player,
+        "pattern": args.pattern,
+        "bosses": args.bosses,
+        "hp": args.hp,
+        "bullet_store": bullet.USE_BULLET_STORE,
+        "updates_per_second": round(len(step_ms) / (sum(step_ms) / 1000), 1),
+        "step_ms": summary(step_ms),
+        "draw_ms": summary(draw_ms),
+        "frame_ms": summary(frame_ms),
+        "allocations": {
+            "gc_collections": sum(stat["collections"] for stat in gc.get_stats()) - gc_before,
+            "allocated_blocks_delta": sys.getallocatedblocks() - blocks_before,
+            "sprites_created": len(bullet.sprite_cache.surfaces) - sprites_before,
+        },
+        "peak_live": dict({entry["name"]: entry["peak"] for entry in bullet.lifetimes.entries},
+                          explosions=peak_explosions),
+        "explosions_dropped": bullet.explosions.dropped,
+        "player_hits": hits,
+        "budget_ms": args.budget_ms,
+        "frames_over_budget": over,
+        "passed": over == 0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless stress run for bullet.py")
+    parser.add_argument("--steps", type=int, default=1800, help="measured steps (60 per simulated second)")
+    parser.add_argument("--warmup", type=int, default=120, help="unmeasured steps before the run")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--player", choices=("still", "sweep", "random"), default="random")
+    parser.add_argument("--pattern", choices=sorted(PATTERNS), default="default")
+    parser.add_argument("--bosses", type=int, default=1)
+    parser.add_argument("--hp", type=float, default=1.0, help="boss hp fraction, pinned to force a phase")
+    parser.add_argument("--budget-ms", type=float, default=16.0)
+    parser.add_argument("--out", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    pygame.quit()
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,25 @@
 import pygame
+import argparse
 import random
 import math
 import os
+import sys
 import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice
+
+import slither_brain
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 # Game config
 WIDTH, HEIGHT = 900, 700  # window size is now bigger
-MAP_WIDTH, MAP_HEIGHT = 3200, 2400
+MAP_WIDTH, MAP_HEIGHT = 20000, 20000
 FPS = 60
 SNAKE_RADIUS = 8
 FOOD_RADIUS = 4
@@ -16,6 +29,16 @@ BOOST_MULTIPLIER = 2
 BOOST_COST = 0.2
 BOT_RESPAWN_DELAY = 5.0
 FOOD_COUNT = 200
+FOOD_CELL_SIZE = 64
+SEGMENT_CELL_SIZE = 32
+AI_SLICES = 4  # far-away bots fully re-decide every AI_SLICES frames
+AI_NEAR_RADIUS = 1200  # bots this close to the player decide every frame
+AI_CELL_SIZE = 256
+USE_ARENA = False  # run all snakes through the NumPy SnakeArena core (needs numpy)
+AI_WORKERS = 0  # >0 runs bot brains in that many worker processes, a frame late
+MINIMAP_SIZE = 120
+MINIMAP_HZ = 10  # minimap redraws per second; it is blitted from cache in between
+MINIMAP_HEATMAP = False  # shade the minimap by food density
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -31,11 +54,19 @@ BOT_COLORS = [
 ]
 SNAKE_FACES = ["😀", "😈", "😁", "😎", "🤪", "🥶", "🥳", "😏", "😭", "😬", "🐍", "👽", "🥸", "😅"]
 
+# Bots past the named colours pick from this fixed set rather than any RGB,
+# so the per-colour sprite caches and food colour ids stay bounded
+BOT_COLOR_LEVELS = (100, 152, 204, 255)
+EXTRA_BOT_COLORS = [(r, g, b) for r in BOT_COLOR_LEVELS for g in BOT_COLOR_LEVELS for b in BOT_COLOR_LEVELS]
+
 def get_unique_bot_color(idx):
     if idx < len(BOT_COLORS):
         return BOT_COLORS[idx]
-    r = lambda: random.randint(100,255)
-    return (r(), r(), r())
+    return random.choice(EXTRA_BOT_COLORS)
+
+if any(arg.startswith("--bench") for arg in sys.argv[1:]):
+    # Benchmarks run without a window
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -46,6 +77,8 @@ small_font = pygame.font.SysFont(None, 24)
 face_font = pygame.font.SysFont("Segoe UI Emoji, DejaVu Sans", 32, bold=True)
 
 HIGH_SCORE_FILE = "highscore.txt"
+BG_CACHE_DIR = ".slither_cache"
+BG_VERSION = 1
 
 def load_high_score():
     if os.path.exists(HIGH_SCORE_FILE):
@@ -66,7 +99,37 @@ def make_glow_surface(color, radius=16):
     pygame.draw.circle(surf, color, (center, center), FOOD_RADIUS)
     return surf
 
-def create_gradient_bg(width, height):
+def bg_cache_path(width, height):
+    # Every parameter that shapes the picture goes into the key
+    key = f"bg_v{BG_VERSION}_{width}x{height}_l18-24-1.7_v120"
+    return os.path.join(BG_CACHE_DIR, key + ".png")
+
+def vignette_alpha_rows(width, height):
+    center = (width // 2, height // 2)
+    xs = [((x - center[0]) / width) ** 2 for x in range(width)]
+    for y in range(height):
+        dy2 = ((y - center[1]) / height) ** 2
+        yield bytes([int(120 * min(1, (dx2 + dy2) * 2)) for dx2 in xs])
+
+def make_vignette(width, height):
+    if numpy is not None:
+        center = (width // 2, height // 2)
+        dx = (numpy.arange(width) - center[0]) / width
+        dy = (numpy.arange(height) - center[1]) / height
+        dist = dx[:, None] ** 2 + dy[None, :] ** 2
+        vignette = pygame.Surface((width, height), pygame.SRCALPHA)
+        vignette.fill((0, 0, 0, 0))
+        alpha = pygame.surfarray.pixels_alpha(vignette)
+        alpha[:] = (120 * numpy.minimum(1, dist * 2)).astype(numpy.uint8)
+        del alpha
+        return vignette
+    # Pure-Python fallback: build the RGBA buffer a row at a time
+    buf = bytearray(width * height * 4)
+    for y, row in enumerate(vignette_alpha_rows(width, height)):
+        buf[y * width * 4 + 3:(y + 1) * width * 4:4] = row
+    return pygame.image.frombuffer(bytes(buf), (width, height), "RGBA")
+
+def build_gradient_bg(width, height):
     bg = pygame.Surface((width, height))
     center = (width // 2, height // 2)
     max_radius = int(math.hypot(center[0], center[1]))
@@ -75,67 +138,302 @@ def create_gradient_bg(width, height):
         lum = int(18 + 24 * ((1 - v) ** 1.7))
         color = (lum, lum, int(lum * 1.15))
         pygame.draw.circle(bg, color, center, r)
-    vignette = pygame.Surface((width, height), pygame.SRCALPHA)
-    for y in range(height):
-        for x in range(width):
-            dx = (x - center[0]) / width
-            dy = (y - center[1]) / height
-            dist = dx * dx + dy * dy
-            alpha = int(120 * min(1, dist*2))
-            vignette.set_at((x, y), (0,0,0, alpha))
-    bg.blit(vignette, (0, 0))
+    bg.blit(make_vignette(width, height), (0, 0))
+    return bg
+
+def create_gradient_bg(width, height):
+    path = bg_cache_path(width, height)
+    if os.path.exists(path):
+        try:
+            bg = pygame.image.load(path)
+            if bg.get_size() == (width, height):
+                return bg.convert()
+        except pygame.error:
+            pass
+    bg = build_gradient_bg(width, height)
+    try:
+        os.makedirs(BG_CACHE_DIR, exist_ok=True)
+        pygame.image.save(bg, path)
+    except (OSError, pygame.error):
+        pass
     return bg
 
+SEGMENT_TINT_STEPS = 129  # segi*2 has saturated every channel by segi 128
+SPRITE_KEY = (1, 2, 3)
+face_fonts = {32: face_font}
+face_cache = {}
+
+def render_face(face, size=32):
+    key = (face, size)
+    surf = face_cache.get(key)
+    if surf is None:
+        if size not in face_fonts:
+            face_fonts[size] = pygame.font.SysFont("Segoe UI Emoji, DejaVu Sans", size, bold=True)
+        surf = face_cache[key] = face_fonts[size].render(face, True, (255,255,255))
+    return surf
+
+def make_segment_atlas(color, radius=SNAKE_RADIUS):
+    # One pre-tinted circle per segment index, matching min(255, c + segi*2)
+    atlas = []
+    for segi in range(SEGMENT_TINT_STEPS):
+        tint = tuple(min(255, c + segi * 2) for c in color[:3])
+        # Colour-keyed rather than per-pixel alpha: copies the exact tint and blits faster
+        surf = pygame.Surface((radius*2 + 1, radius*2 + 1)).convert()
+        surf.fill(SPRITE_KEY)
+        pygame.draw.circle(surf, tint, (radius, radius), radius)
+        surf.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+        atlas.append(surf)
+    return atlas
+
 class Food:
-    surface_cache = {}
-    def __init__(self, pos=None, color=(255,180,180)):
-        self.pos = list(pos) if pos else [random.randint(0, MAP_WIDTH), random.randint(0, MAP_HEIGHT)]
-        self.color = color
-        key = color[:3]
-        if key not in Food.surface_cache:
-            Food.surface_cache[key] = make_glow_surface(color)
-        self.glow_surf = Food.surface_cache[key]
-    def draw(self, offset):
-        base_pos = self.pos
-        for dx in (-MAP_WIDTH, 0, MAP_WIDTH):
-            for dy in (-MAP_HEIGHT, 0, MAP_HEIGHT):
-                draw_x = base_pos[0] + dx
-                draw_y = base_pos[1] + dy
-                camx, camy = offset
-                screenx = int(draw_x - camx)
-                screeny = int(draw_y - camy)
-                if -40 < screenx < WIDTH+40 and -40 < screeny < HEIGHT+40:
-                    rect = self.glow_surf.get_rect(center=(screenx, screeny))
-                    screen.blit(self.glow_surf, rect)
+    """Food colours: each gets a small id, and its glow sprite lives at that
+    index in surface_cache. The food itself lives in a FoodField pool.
+    Snake colours come from a fixed palette, so the ids stay few and fit
+    the pool's 16-bit colour column."""
+    DEFAULT_COLOR = (255,180,180)
+    palette = []
+    palette_ids = {}
+    surface_cache = []
+
+    @classmethod
+    def color_id(cls, color):
+        key = tuple(color[:3])
+        cid = cls.palette_ids.get(key)
+        if cid is None:
+            cid = cls.palette_ids[key] = len(cls.palette)
+            cls.palette.append(key)
+            cls.surface_cache.append(make_glow_surface(key))
+        return cid
+
+class WrapGrid:
+    """Uniform bucket grid over the wrap-around map, cells keyed by int."""
+    def __init__(self, cell_size, width=None, height=None):
+        width = MAP_WIDTH if width is None else width
+        height = MAP_HEIGHT if height is None else height
+        # Round so the cells tile the map exactly and wrapping stays seamless
+        self.cols = max(1, int(width // cell_size))
+        self.rows = max(1, int(height // cell_size))
+        self.cell_w = width / self.cols
+        self.cell_h = height / self.rows
+
+    def cell_of(self, x, y):
+        return (int(x // self.cell_w) % self.cols) + (int(y // self.cell_h) % self.rows) * self.cols
+
+    def cells_in_rect(self, x0, y0, x1, y1):
+        # Coordinates may lie outside the map (unwrapped); cells wrap around
+        c0, c1 = int(x0 // self.cell_w), int(x1 // self.cell_w)
+        r0, r1 = int(y0 // self.cell_h), int(y1 // self.cell_h)
+        if c1 - c0 >= self.cols:
+            c0, c1 = 0, self.cols - 1
+        if r1 - r0 >= self.rows:
+            r0, r1 = 0, self.rows - 1
+        cols = [c % self.cols for c in range(c0, c1 + 1)]
+        for r in range(r0, r1 + 1):
+            row = (r % self.rows) * self.cols
+            for c in cols:
+                yield row + c
+
+class FoodField:
+    """Preallocated pool of food in parallel arrays, indexed by a WrapGrid.
+
+    A food item is a slot number; x, y, colour id, alive flag and cell live
+    in flat arrays. Freed slots go on a free list, so respawns and death
+    drops reuse them without allocating. serial gives each spawn a stable
+    id. The pool only grows, by doubling, when every slot is taken.
+    """
+    def __init__(self, capacity=FOOD_COUNT * 4, cell_size=FOOD_CELL_SIZE):
+        self.grid = WrapGrid(cell_size)
+        self.capacity = 0
+        self.x = array('d')
+        self.y = array('d')
+        self.color = array('H')
+        self.cell = array('l')
+        self.serial = array('L')
+        self.alive = bytearray()
+        self.free = []
+        self.count = 0
+        self.spawned = 0
+        self.cells = {}
+        self.pickup_time = 0.0  # seconds spent in collect_food_along_path, for phase timings
+        self.reserve(max(1, capacity))
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return compress(range(self.capacity), self.alive)
+
+    def __bool__(self):
+        return self.count > 0
+
+    def reserve(self, capacity):
+        if capacity <= self.capacity:
+            return
+        extra = capacity - self.capacity
+        self.x.extend(array('d', bytes(8 * extra)))
+        self.y.extend(array('d', bytes(8 * extra)))
+        self.color.extend(array('H', bytes(2 * extra)))
+        self.cell.extend(array('l', bytes(self.cell.itemsize * extra)))
+        self.serial.extend(array('L', bytes(self.serial.itemsize * extra)))
+        self.alive.extend(bytes(extra))
+        # Lowest slots first, so live food stays packed toward the front
+        self.free = list(range(capacity - 1, self.capacity - 1, -1)) + self.free
+        self.capacity = capacity
+
+    def spawn(self, x, y, color_id=0):
+        if not self.free:
+            self.reserve(self.capacity * 2)
+        slot = self.free.pop()
+        self.x[slot] = x
+        self.y[slot] = y
+        self.color[slot] = color_id
+        self.alive[slot] = 1
+        self.spawned += 1
+        self.serial[slot] = self.spawned & 0xFFFFFFFF
+        cell = self.cell[slot] = self.grid.cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = set()
+        bucket.add(slot)
+        self.count += 1
+        return slot
+
+    def spawn_random(self):
+        return self.spawn(random.randint(0, MAP_WIDTH), random.randint(0, MAP_HEIGHT),
+                          Food.color_id(Food.DEFAULT_COLOR))
+
+    def top_up(self, count):
+        while self.count < count:
+            self.spawn_random()
+
+    def remove(self, slot):
+        self.alive[slot] = 0
+        self.cells[self.cell[slot]].discard(slot)
+        self.free.append(slot)
+        self.count -= 1
+
+    def pos(self, slot):
+        return self.x[slot], self.y[slot]
+
+    def nearest(self, x, y):
+        grid = self.grid
+        return slither_brain.nearest_food(
+            x, y, slither_brain.FoodCells((grid.cols, grid.rows, grid.cell_w, grid.cell_h), self.cells, self.count),
+            self.pos)
+
+    def snapshot(self):
+        # Positions by cell, for bot brains that cannot see the pool
+        grid = self.grid
+        pos = self.pos
+        return slither_brain.FoodCells((grid.cols, grid.rows, grid.cell_w, grid.cell_h),
+                                       {cell: [pos(f) for f in bucket] for cell, bucket in self.cells.items() if bucket},
+                                       self.count)
+
+    def near_rect(self, x0, y0, x1, y1):
+        cells = self.cells
+        for cell in self.grid.cells_in_rect(x0, y0, x1, y1):
+            bucket = cells.get(cell)
+            if bucket:
+                yield from list(bucket)
+
+class SegmentHash:
+    """Per-game hash of every live body segment, kept in sync as snakes move."""
+    def __init__(self, cell_size=SEGMENT_CELL_SIZE):
+        self.grid = WrapGrid(cell_size)
+        self.cells = {}
+        self.tracked = set()
+
+    def add(self, snake, serial, x, y):
+        cell = self.grid.cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = {}
+        bucket[(snake, serial)] = (x, y)
+
+    def discard(self, snake, serial, x, y):
+        bucket = self.cells.get(self.grid.cell_of(x, y))
+        if bucket:
+            bucket.pop((snake, serial), None)
+
+    def track(self, snake):
+        self.tracked.add(snake)
+        serial = snake.body.serial
+        for i, (x, y) in enumerate(snake.body):
+            self.add(snake, serial - i, x, y)
+
+    def untrack(self, snake):
+        if snake in self.tracked:
+            self.tracked.discard(snake)
+            serial = snake.body.serial
+            for i, (x, y) in enumerate(snake.body):
+                self.discard(snake, serial - i, x, y)
+
+    def near(self, x, y, radius):
+        return self.near_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def near_rect(self, x0, y0, x1, y1):
+        cells = self.cells
+        for cell in self.grid.cells_in_rect(x0, y0, x1, y1):
+            bucket = cells.get(cell)
+            if bucket:
+                for (snake, serial), (sx, sy) in list(bucket.items()):
+                    yield snake, serial, sx, sy
+
+def wrap_delta(d, size):
+    # Shortest signed distance along a wrapped axis
+    return (d + size / 2) % size - size / 2
 
 def collect_food_along_path(snake, path_end, food_items):
+    # path_end is the unwrapped head destination, so a step over a map seam
+    # stays a short segment instead of spanning the whole map
     if not snake.alive:
         return
-    head = snake.body[0]
-    for food in food_items[:]:
-        fx, fy = food.pos
-        x0, y0 = head
-        x1, y1 = path_end
-        dx, dy = x1 - x0, y1 - y0
-        if dx == 0 and dy == 0:
-            dist = math.hypot(fx - x0, fy - y0)
+    t0 = time.perf_counter()
+    x0, y0 = snake.body[0]
+    x1, y1 = path_end
+    dx, dy = x1 - x0, y1 - y0
+    reach = SNAKE_RADIUS + FOOD_RADIUS
+    seg_len2 = dx * dx + dy * dy
+    candidates = food_items.near_rect(min(x0, x1) - reach, min(y0, y1) - reach,
+                                      max(x0, x1) + reach, max(y0, y1) + reach)
+    xs, ys = food_items.x, food_items.y
+    for food in candidates:
+        fx = wrap_delta(xs[food] - x0, MAP_WIDTH)
+        fy = wrap_delta(ys[food] - y0, MAP_HEIGHT)
+        if seg_len2 == 0:
+            dist = math.hypot(fx, fy)
         else:
-            t = ((fx - x0) * dx + (fy - y0) * dy) / (dx * dx + dy * dy)
+            t = (fx * dx + fy * dy) / seg_len2
             t = max(0.0, min(1.0, t))
-            closest_x = x0 + t * dx
-            closest_y = y0 + t * dy
-            dist = math.hypot(fx - closest_x, fy - closest_y)
-        if dist < SNAKE_RADIUS + FOOD_RADIUS:
+            dist = math.hypot(fx - t * dx, fy - t * dy)
+        if dist < reach:
             snake.grow()
             food_items.remove(food)
+    food_items.pickup_time += time.perf_counter() - t0
+
+class SnakeBody(deque):
+    """Body segments as (x, y) tuples, head first.
+
+    A deque is a ring of fixed-size blocks, so moving is appendleft + pop
+    in O(1) whatever the length, where list.insert(0, ...) shifts every
+    segment. Callers inline the move rather than going through a method:
+    at normal lengths the call would cost more than the move. serial
+    counts pushed heads, so segment i has the stable id serial - i.
+    """
+    __slots__ = ("serial",)
+
+    def __init__(self, x, y):
+        super().__init__(((x, y),))
+        self.serial = 0
 
 class Snake:
     bot_counter = 0
     bot_colors_used = {}
+    atlas_cache = {}
 
     def __init__(self, color, x, y, name="Bot", face=None):
         self.color = color
-        self.body = [[x, y]]
+        self.body = SnakeBody(x, y)
         self.direction = [random.choice([-1, 1]), random.choice([-1, 1])]
         self.length = 10
         self.alive = True
@@ -146,21 +444,23 @@ class Snake:
         self.ai_target_type = None
         self.ai_target_timer = 0
         self.ai_last_target = None
+        self.ai_cached = None
+        self.ai_decided_at = 0
 
     @classmethod
-    def create_bot(cls):
-        idx = cls.bot_counter
-        cls.bot_counter += 1
+    def create_bot(cls, **kwargs):
+        idx = Snake.bot_counter
+        Snake.bot_counter += 1
         clr = get_unique_bot_color(idx)
         face = random.choice(SNAKE_FACES)
-        name = f"Bot{cls.bot_counter}"
+        name = f"Bot{Snake.bot_counter}"
         safe = False
         while not safe:
             x = random.randint(100, MAP_WIDTH - 100)
             y = random.randint(100, MAP_HEIGHT - 100)
             if (MAP_WIDTH//2-250 > x or x > MAP_WIDTH//2+250) or (MAP_HEIGHT//2-250 > y or y > MAP_HEIGHT//2+250):
                 safe = True
-        return Snake(clr, x, y, name=name, face=face)
+        return cls(clr, x, y, name=name, face=face, **kwargs)
 
     def respawn(self):
         x, y = 0, 0
@@ -170,22 +470,25 @@ class Snake:
             y = random.randint(100, MAP_HEIGHT - 100)
             if (MAP_WIDTH//2-250 > x or x > MAP_WIDTH//2+250) or (MAP_HEIGHT//2-250 > y or y > MAP_HEIGHT//2+250):
                 safe = True
-        self.body = [[x, y]]
+        self.body = SnakeBody(x, y)
         self.length = 10
         self.alive = True
         self.direction = [random.choice([-1,1]), random.choice([-1,1])]
         self.respawn_time = 0
         self.ai_last_target = None
         self.ai_target_timer = 0
+        self.ai_cached = None
 
-    def update(self, target=None, boosting=False, food_items=None, avoid=None):
+    def update(self, target=None, boosting=False, food_items=None, avoid=None, segments=None):
         if not self.alive:
             return
+        if segments is not None and self not in segments.tracked:
+            segments.track(self)
         if hasattr(self, "is_bot") and self.last_turn != 0 and random.random() < 0.1:
             angle = math.atan2(self.direction[1], self.direction[0])
             angle += random.uniform(-0.15, 0.15)
             self.direction = [math.cos(angle), math.sin(angle)]
-        head = self.body[0][:]
+        head = self.body[0]
         speed = SNAKE_SPEED * BOOST_MULTIPLIER if boosting else SNAKE_SPEED
         if avoid:
             avoid_angle = math.atan2(head[1]-avoid[1], head[0]-avoid[0])
@@ -198,15 +501,19 @@ class Snake:
                 main_angle = math.atan2(self.direction[1], self.direction[0])
                 angle = main_angle * 0.8 + angle * 0.2
             self.direction = [math.cos(angle), math.sin(angle)]
-        new_head = [
-            (head[0] + self.direction[0] * speed) % MAP_WIDTH,
-            (head[1] + self.direction[1] * speed) % MAP_HEIGHT
-        ]
+        path_end = [head[0] + self.direction[0] * speed, head[1] + self.direction[1] * speed]
         if food_items is not None:
-            collect_food_along_path(self, new_head, food_items)
-        self.body.insert(0, new_head)
-        if len(self.body) > self.length:
-            self.body.pop()
+            collect_food_along_path(self, path_end, food_items)
+        body = self.body
+        x, y = path_end[0] % MAP_WIDTH, path_end[1] % MAP_HEIGHT
+        body.appendleft((x, y))
+        body.serial += 1
+        if segments is not None:
+            segments.add(self, body.serial, x, y)
+        if len(body) > self.length:
+            tx, ty = body.pop()
+            if segments is not None:
+                segments.discard(self, body.serial - len(body), tx, ty)
         if boosting and self.length > 10:
             self.length -= BOOST_COST
 
@@ -214,46 +521,264 @@ class Snake:
         self.length += 5
     def score(self):
         return int(self.length - 10)
-    def check_collision(self, snakes, food_items):
+    def check_collision(self, snakes, food_items, segments=None, now=None):
         if not self.alive:
             return
-        head = self.body[0]
-        for snake in snakes:
-            if snake is self or not snake.alive:
+        if segments is not None:
+            hit = self.hits_segment(segments)
+        else:
+            head = self.body[0]
+            hit = any(
+                math.hypot(head[0] - segment[0], head[1] - segment[1]) < SNAKE_RADIUS * 2
+                for snake in snakes if snake is not self and snake.alive
+                for segment in islice(snake.body, 1, None)
+            )
+        if hit:
+            color_id = Food.color_id(self.color)
+            for x, y in self.body:
+                food_items.spawn(x, y, color_id)
+            self.alive = False
+            self.died_at = time.time() if now is None else now
+            if segments is not None:
+                segments.untrack(self)
+
+    def hits_segment(self, segments):
+        hx, hy = self.body[0]
+        reach = SNAKE_RADIUS * 2
+        reach2 = reach * reach
+        for snake, serial, sx, sy in segments.near(hx, hy, reach):
+            if snake is self or not snake.alive or serial == snake.body.serial:
                 continue
-            for segment in snake.body[1:]:
-                if math.hypot(head[0] - segment[0], head[1] - segment[1]) < SNAKE_RADIUS * 2:
-                    for seg in self.body:
-                        food_items.append(Food(pos=seg, color=self.color))
-                    self.alive = False
-                    self.died_at = time.time()
-                    return
+            dx = wrap_delta(hx - sx, MAP_WIDTH)
+            dy = wrap_delta(hy - sy, MAP_HEIGHT)
+            if dx * dx + dy * dy < reach2:
+                return True
+        return False
 
     def draw(self, offset):
         if not self.alive:
             return
-        head_drawn = False
-        for segi, seg in enumerate(self.body):
-            for dx in (-MAP_WIDTH, 0, MAP_WIDTH):
-                for dy in (-MAP_HEIGHT, 0, MAP_HEIGHT):
-                    segx = seg[0] + dx
-                    segy = seg[1] + dy
-                    camx, camy = offset
-                    screenx = int(segx - camx)
-                    screeny = int(segy - camy)
-                    if -20 < screenx < WIDTH+20 and -20 < screeny < HEIGHT+20:
-                        color = (
-                            min(255, self.color[0] + segi * 2),
-                            min(255, self.color[1] + segi * 2),
-                            min(255, self.color[2] + segi * 2),
-                        )
-                        pygame.draw.circle(screen, color, (screenx, screeny), SNAKE_RADIUS)
-                        # Draw the face at the head (segi == 0) only once per segment
-                        if not head_drawn and segi == 0:
-                            face_surf = face_font.render(self.face, True, (255,255,255))
-                            f_rect = face_surf.get_rect(center=(screenx, screeny))
-                            screen.blit(face_surf, f_rect)
-                            head_drawn = True
+        atlas = Snake.atlas_cache.get(self.color)
+        if atlas is None:
+            atlas = Snake.atlas_cache[self.color] = make_segment_atlas(self.color)
+        last = len(atlas) - 1
+        camx, camy = offset
+        r = SNAKE_RADIUS
+        batch = []
+        face_surf = render_face(self.face)
+        if MAP_WIDTH > WIDTH + 40 and MAP_HEIGHT > HEIGHT + 40:
+            # Only one wrapped copy can be on screen: fold it into view directly
+            left, top = 20 - camx, 20 - camy
+            right, bottom = WIDTH + 40, HEIGHT + 40
+            for segi, (x, y) in enumerate(self.body):
+                sx = (x + left) % MAP_WIDTH
+                sy = (y + top) % MAP_HEIGHT
+                if 0 < sx < right and 0 < sy < bottom:
+                    screenx, screeny = int(sx - 20), int(sy - 20)
+                    batch.append((atlas[segi if segi < last else last], (screenx - r, screeny - r)))
+                    # The face sits on the head, under the body
+                    if segi == 0:
+                        batch.append((face_surf, face_surf.get_rect(center=(screenx, screeny))))
+        else:
+            for segi, seg in enumerate(self.body):
+                sprite = atlas[segi if segi < last else last]
+                for dx in (-MAP_WIDTH, 0, MAP_WIDTH):
+                    for dy in (-MAP_HEIGHT, 0, MAP_HEIGHT):
+                        screenx = int(seg[0] + dx - camx)
+                        screeny = int(seg[1] + dy - camy)
+                        if -20 < screenx < WIDTH+20 and -20 < screeny < HEIGHT+20:
+                            batch.append((sprite, (screenx - r, screeny - r)))
+                            if segi == 0 and len(batch) == 1:
+                                batch.append((face_surf, face_surf.get_rect(center=(screenx, screeny))))
+        screen.blits(batch, doreturn=False)
+
+class SnakeArena:
+    """Struct-of-arrays core that moves every snake in one NumPy step.
+
+    Heading, speed, boost flag and length live in arrays indexed by slot;
+    ArenaSnake objects are thin views onto their row, so the rest of the
+    game keeps using the Snake API. Bodies stay in each snake's SnakeBody.
+    """
+    def __init__(self, capacity=64):
+        if numpy is None:
+            raise RuntimeError("SnakeArena requires numpy")
+        self.snakes = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+        self.direction = numpy.zeros((capacity, 2))
+        self.speed = numpy.zeros(capacity)
+        self.boosting = numpy.zeros(capacity, dtype=bool)
+        self.length = numpy.zeros(capacity)
+
+    def allocate(self, snake):
+        if not self.free:
+            old = len(self.snakes)
+            self.snakes.extend([None] * old)
+            self.free = list(range(2 * old - 1, old - 1, -1))
+            self.direction = numpy.concatenate([self.direction, numpy.zeros((old, 2))])
+            self.speed = numpy.concatenate([self.speed, numpy.zeros(old)])
+            self.boosting = numpy.concatenate([self.boosting, numpy.zeros(old, dtype=bool)])
+            self.length = numpy.concatenate([self.length, numpy.zeros(old)])
+        slot = self.free.pop()
+        self.snakes[slot] = snake
+        return slot
+
+    def release(self, snake):
+        self.snakes[snake.slot] = None
+        self.free.append(snake.slot)
+
+    def step(self, decisions, food_items=None, segments=None):
+        # Same maths as Snake.update, for every deciding snake at once.
+        # Snake.update's random jitter is gated on last_turn, which nothing
+        # sets, so it is left out here.
+        movers = [(snake, d) for snake, d in decisions if snake.alive]
+        if not movers:
+            return
+        if segments is not None:
+            for snake, _ in movers:
+                if snake not in segments.tracked:
+                    segments.track(snake)
+        # Gather into plain lists and convert once; per-element numpy stores are slow
+        slots, heads, targets, avoids, flags = [], [], [], [], []
+        none = (0.0, 0.0)
+        for snake, (tgt, avd, boosting) in movers:
+            slots.append(snake.slot)
+            heads.append(snake.body[0])
+            targets.append(tgt or none)
+            avoids.append(avd or none)
+            flags.append((bool(tgt), bool(avd), bool(boosting), hasattr(snake, "is_bot")))
+        idx = numpy.array(slots, dtype=numpy.intp)
+        head = numpy.array(heads)
+        target = numpy.array(targets, dtype=float)
+        avoid = numpy.array(avoids, dtype=float)
+        has_target, has_avoid, boost, blend = numpy.array(flags, dtype=bool).T
+
+        direction = self.direction[idx]
+        main_angle = numpy.arctan2(direction[:, 1], direction[:, 0])
+        avoid_angle = numpy.arctan2(head[:, 1] - avoid[:, 1], head[:, 0] - avoid[:, 0])
+        angle = numpy.where(has_avoid, main_angle * 0.85 + avoid_angle * 0.15, main_angle)
+        target_angle = numpy.arctan2(target[:, 1] - head[:, 1], target[:, 0] - head[:, 0])
+        target_angle = numpy.where(blend, angle * 0.8 + target_angle * 0.2, target_angle)
+        steered = has_avoid | has_target
+        angle = numpy.where(has_target, target_angle, angle)
+        direction[steered, 0] = numpy.cos(angle[steered])
+        direction[steered, 1] = numpy.sin(angle[steered])
+        self.direction[idx] = direction
+        speed = numpy.where(boost, SNAKE_SPEED * BOOST_MULTIPLIER, SNAKE_SPEED)
+        self.speed[idx] = speed
+        self.boosting[idx] = boost
+        path_end = head + direction * speed[:, None]
+        new_head = numpy.mod(path_end, (MAP_WIDTH, MAP_HEIGHT))
+
+        path_end = path_end.tolist()
+        new_head = new_head.tolist()
+        lengths = self.length[idx].tolist()
+        for (snake, _), end, (x, y), length in zip(movers, path_end, new_head, lengths):
+            if food_items is not None:
+                eaten = len(food_items)
+                collect_food_along_path(snake, end, food_items)
+                if len(food_items) != eaten:
+                    length = snake.length
+            body = snake.body
+            body.appendleft((x, y))
+            body.serial += 1
+            if segments is not None:
+                segments.add(snake, body.serial, x, y)
+            if len(body) > length:
+                tx, ty = body.pop()
+                if segments is not None:
+                    segments.discard(snake, body.serial - len(body), tx, ty)
+        length = self.length[idx]
+        self.length[idx] = numpy.where(boost & (length > 10), length - BOOST_COST, length)
+
+class ArenaSnake(Snake):
+    """A Snake whose heading and length are a row of a SnakeArena."""
+    def __init__(self, color, x, y, name="Bot", face=None, arena=None):
+        self.arena = arena
+        self.slot = arena.allocate(self)
+        super().__init__(color, x, y, name=name, face=face)
+
+    @property
+    def direction(self):
+        return self.arena.direction[self.slot].tolist()
+
+    @direction.setter
+    def direction(self, value):
+        self.arena.direction[self.slot] = value
+
+    @property
+    def length(self):
+        return float(self.arena.length[self.slot])
+
+    @length.setter
+    def length(self, value):
+        self.arena.length[self.slot] = value
+
+class Camera:
+    """The screen's view of the wrapped map for one frame.
+
+    The viewport is split once into the (at most four) map tiles it
+    overlaps; each piece is a map-space rect plus the shift that turns
+    map coordinates into screen coordinates. Drawing queries the spatial
+    indexes over those rects only, so cost follows what is visible.
+    """
+    def __init__(self, offset, margin=40):
+        self.offset = offset
+        xs = self.spans(offset[0] - margin, offset[0] + WIDTH + margin, MAP_WIDTH, offset[0])
+        ys = self.spans(offset[1] - margin, offset[1] + HEIGHT + margin, MAP_HEIGHT, offset[1])
+        self.pieces = [(x0, y0, x1, y1, shx, shy) for x0, x1, shx in xs for y0, y1, shy in ys]
+
+    @staticmethod
+    def spans(lo, hi, size, cam):
+        spans = []
+        tile = math.floor(lo / size)
+        while tile * size <= hi:
+            base = tile * size
+            spans.append((max(lo, base) - base, min(hi, base + size) - base, base - cam))
+            tile += 1
+        return spans
+
+    def draw_food(self, food_items):
+        xs, ys, colors, glows = food_items.x, food_items.y, food_items.color, Food.surface_cache
+        for x0, y0, x1, y1, shx, shy in self.pieces:
+            for food in food_items.near_rect(x0, y0, x1, y1):
+                screenx = int(xs[food] + shx)
+                screeny = int(ys[food] + shy)
+                if -40 < screenx < WIDTH+40 and -40 < screeny < HEIGHT+40:
+                    glow = glows[colors[food]]
+                    screen.blit(glow, glow.get_rect(center=(screenx, screeny)))
+
+    def draw_snakes(self, snakes, segments):
+        visible = {}
+        for x0, y0, x1, y1, shx, shy in self.pieces:
+            for snake, serial, x, y in segments.near_rect(x0, y0, x1, y1):
+                screenx = int(x + shx)
+                screeny = int(y + shy)
+                if -20 < screenx < WIDTH+20 and -20 < screeny < HEIGHT+20:
+                    segi = snake.body.serial - serial
+                    visible.setdefault(snake, []).append((segi, screenx, screeny))
+        r = SNAKE_RADIUS
+        for snake in snakes:
+            if not snake.alive:
+                continue
+            if snake not in segments.tracked:
+                snake.draw(self.offset)
+                continue
+            segs = visible.get(snake)
+            if not segs:
+                continue
+            # Head first, so later segments overlap it exactly as Snake.draw does
+            segs.sort()
+            atlas = Snake.atlas_cache.get(snake.color)
+            if atlas is None:
+                atlas = Snake.atlas_cache[snake.color] = make_segment_atlas(snake.color)
+            last = len(atlas) - 1
+            batch = []
+            for segi, screenx, screeny in segs:
+                batch.append((atlas[segi if segi < last else last], (screenx - r, screeny - r)))
+                if segi == 0:
+                    face_surf = render_face(snake.face)
+                    batch.append((face_surf, face_surf.get_rect(center=(screenx, screeny))))
+            screen.blits(batch, doreturn=False)
 
 def show_game_over():
     text = font.render("Game Over! Press R to Restart", True, YELLOW)
@@ -265,24 +790,97 @@ def draw_score(player, high_score):
     score_text = small_font.render(f"Score: {player.score()}  High: {high_score}", True, WHITE)
     screen.blit(score_text, (10, 10))
 
-def draw_minimap(player, bots):
-    minimap_size = 120
-    minimap = pygame.Surface((minimap_size, minimap_size))
-    minimap.fill((30, 30, 30))
-    scale_x = minimap_size / MAP_WIDTH
-    scale_y = minimap_size / MAP_HEIGHT
-    for bot in bots:
-        if bot.alive:
-            x, y = bot.body[0]
-            pygame.draw.circle(minimap, bot.color, (int(x * scale_x), int(y * scale_y)), 2)
-            label = small_font.render(str(bot.name), True, bot.color)
-            minimap.blit(label, (int(x * scale_x) + 4, int(y * scale_y)))
-    if player.alive:
-        x, y = player.body[0]
-        pygame.draw.circle(minimap, BLUE, (int(x * scale_x), int(y * scale_y)), 3)
-        label = small_font.render("You", True, BLUE)
-        minimap.blit(label, (int(x * scale_x) + 4, int(y * scale_y)))
-    screen.blit(minimap, (WIDTH - minimap_size - 10, 10))
+class Minimap:
+    """The corner map, redrawn into its own surface only refresh_hz times a
+    second and blitted as-is in between.
+
+    The background (and the food heatmap, when on) is cached; dots and
+    name labels come from sprite caches and go out in one blits batch.
+    Bot colours come from a fixed palette, so the dot cache only reaches
+    its limit if colours are set some other way.
+    """
+    LABEL_CACHE_LIMIT = 512
+    DOT_CACHE_LIMIT = 256
+
+    def __init__(self, size=MINIMAP_SIZE, refresh_hz=MINIMAP_HZ, heatmap=MINIMAP_HEATMAP):
+        self.size = size
+        self.period = 1.0 / refresh_hz if refresh_hz > 0 else 0.0
+        self.heatmap = heatmap
+        self.base = pygame.Surface((size, size))
+        self.base.fill((30, 30, 30))
+        self.surface = self.base.copy()
+        self.dots = {}
+        self.labels = {}
+        self.refreshed_at = None
+
+    def dot(self, color, radius):
+        key = (color, radius)
+        surf = self.dots.get(key)
+        if surf is None:
+            if len(self.dots) >= self.DOT_CACHE_LIMIT:
+                self.dots.clear()
+            surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+            surf.fill(SPRITE_KEY)
+            pygame.draw.circle(surf, color, (radius, radius), radius)
+            surf.set_colorkey(SPRITE_KEY)
+            surf = self.dots[key] = surf.convert()
+        return surf
+
+    def label(self, text, color):
+        key = (text, color)
+        surf = self.labels.get(key)
+        if surf is None:
+            if len(self.labels) >= self.LABEL_CACHE_LIMIT:
+                self.labels.clear()
+            surf = self.labels[key] = small_font.render(text, True, color)
+        return surf
+
+    def food_heat(self, food_items):
+        # Food per minimap pixel, read off the pool's grid buckets
+        size = self.size
+        grid = food_items.grid
+        counts = [0] * (size * size)
+        sx, sy = size / grid.cols, size / grid.rows
+        for cell, bucket in food_items.cells.items():
+            if bucket:
+                col, row = cell % grid.cols, cell // grid.cols
+                counts[int(row * sy) * size + int(col * sx)] += len(bucket)
+        peak = max(counts) or 1
+        heat = bytearray(3 * size * size)
+        for i, n in enumerate(counts):
+            if n:
+                level = 30 + int(120 * n / peak)
+                heat[3 * i:3 * i + 3] = bytes((level, level // 2, 30))
+        surf = pygame.image.frombuffer(bytes(heat), (size, size), "RGB").convert()
+        surf.set_colorkey((0, 0, 0))
+        return surf
+
+    def refresh(self, player, bots, food_items=None):
+        surface = self.surface
+        surface.blit(self.base, (0, 0))
+        if self.heatmap and food_items is not None:
+            surface.blit(self.food_heat(food_items), (0, 0))
+        scale_x = self.size / MAP_WIDTH
+        scale_y = self.size / MAP_HEIGHT
+        batch = []
+        for bot in bots:
+            if bot.alive:
+                x, y = bot.body[0]
+                px, py = int(x * scale_x), int(y * scale_y)
+                batch.append((self.dot(bot.color, 2), (px - 2, py - 2)))
+                batch.append((self.label(str(bot.name), bot.color), (px + 4, py)))
+        if player.alive:
+            x, y = player.body[0]
+            px, py = int(x * scale_x), int(y * scale_y)
+            batch.append((self.dot(BLUE, 3), (px - 3, py - 3)))
+            batch.append((self.label("You", BLUE), (px + 4, py)))
+        surface.blits(batch, doreturn=False)
+
+    def draw(self, player, bots, now, food_items=None):
+        if self.refreshed_at is None or now - self.refreshed_at >= self.period or now < self.refreshed_at:
+            self.refresh(player, bots, food_items)
+            self.refreshed_at = now
+        screen.blit(self.surface, (WIDTH - self.size - 10, 10))
 
 def bot_avoid_target(bot, threats):
     closest = None
@@ -301,13 +899,19 @@ def bot_avoid_target(bot, threats):
                 min_dist = dist
     return closest
 
-def bot_ai_decision(bot, bots, player, food_items, framecount):
+def bot_ai_decision(bot, bots, player, food_items, framecount, snapshot=None, elapsed=1):
+    if snapshot is not None:
+        # Only snakes within threat or prey range can matter
+        hx, hy = bot.body[0]
+        others = snapshot.near(hx, hy, max(70 + bot.length, 180))
+    else:
+        others = [player] + bots
     # Avoid big snakes that are too close
-    threats = [sn for sn in [player]+bots if sn is not bot and sn.alive and sn.length > bot.length+4]
+    threats = [sn for sn in others if sn is not bot and sn.alive and sn.length > bot.length+4]
     avoid = bot_avoid_target(bot, threats)
 
     # Target nearby eatable snake if I'm big enough, else food
-    prey_candidates = [sn for sn in [player]+bots
+    prey_candidates = [sn for sn in others
                        if sn is not bot and sn.alive and sn.length <= bot.length+8]
     prey = None
     prey_dist = 99999999
@@ -323,9 +927,8 @@ def bot_ai_decision(bot, bots, player, food_items, framecount):
     else:
         # Find nearest visible food
         if food_items:
-            head = bot.body[0]
-            nearest_food = min(food_items, key=lambda f: math.hypot(f.pos[0]-head[0], f.pos[1]-head[1]))
-            target = nearest_food.pos
+            nearest_food = food_items.nearest(*bot.body[0])
+            target = [food_items.x[nearest_food], food_items.y[nearest_food]]
             boosting = (bot.length > 20) and random.random() < 0.10
         else:
             target = None
@@ -334,31 +937,253 @@ def bot_ai_decision(bot, bots, player, food_items, framecount):
     # Occasionally, stick to a previous target for a few frames for realism
     if hasattr(bot, "ai_last_target") and bot.ai_last_target and bot.ai_target_timer > 0:
         target = bot.ai_last_target
-        bot.ai_target_timer -= 1
+        bot.ai_target_timer -= elapsed
     else:
         bot.ai_last_target = target
         bot.ai_target_timer = random.randint(8,20)
     return target, avoid, boosting
 
-def main():
-    def reset_game():
+class AISnapshot:
+    """Heads of every live snake, bucketed once per frame for all bot decisions."""
+    def __init__(self, snakes, cell_size=AI_CELL_SIZE):
+        self.grid = WrapGrid(cell_size)
+        self.cells = {}
+        for snake in snakes:
+            if snake.alive:
+                hx, hy = snake.body[0]
+                self.cells.setdefault(self.grid.cell_of(hx, hy), []).append(snake)
+
+    def near(self, x, y, radius):
+        # Heads may have moved a step since the snapshot, so pad the query
+        radius += SNAKE_SPEED * BOOST_MULTIPLIER
+        found = []
+        for cell in self.grid.cells_in_rect(x - radius, y - radius, x + radius, y + radius):
+            found.extend(self.cells.get(cell, ()))
+        return found
+
+class BotScheduler:
+    """Time-slices bot AI: one shared snapshot per frame, full decisions spread
+    over AI_SLICES frames, with bots near the player deciding every frame.
+    In between, a bot keeps steering toward its cached ai_last_target."""
+    def __init__(self, slices=AI_SLICES, near_radius=AI_NEAR_RADIUS):
+        self.slices = slices
+        self.near_radius = near_radius
+
+    def decide(self, bots, player, food_items, framecount, others=()):
+        # others: further human snakes (networked games); player may then be None
+        humans = [h for h in (player, *others) if h is not None]
+        snapshot = AISnapshot(humans + bots)
+        watch = [h.body[0] for h in humans if h.alive]
+        near2 = self.near_radius * self.near_radius
+        for i, bot in enumerate(bots):
+            if not bot.alive:
+                continue
+            hx, hy = bot.body[0]
+            due = bot.ai_cached is None or (i + framecount) % self.slices == 0
+            for px, py in watch:
+                if due:
+                    break
+                dx = wrap_delta(hx - px, MAP_WIDTH)
+                dy = wrap_delta(hy - py, MAP_HEIGHT)
+                due = dx * dx + dy * dy < near2
+            if due:
+                elapsed = max(1, framecount - bot.ai_decided_at)
+                bot.ai_cached = bot_ai_decision(bot, bots, player, food_items, framecount,
+                                                snapshot=snapshot, elapsed=elapsed)
+                bot.ai_decided_at = framecount
+                yield bot, bot.ai_cached
+            else:
+                _, avoid, boosting = bot.ai_cached
+                yield bot, (bot.ai_last_target, avoid, boosting)
+
+class BotBrainPool:
+    """Runs bot decisions in worker processes over compact snapshots.
+
+    Each frame ships (heads, lengths, food) to the pool and applies the
+    answers submitted the frame before, so bots act one frame late while
+    the render loop stays on the main process. With no workers, or if the
+    pool cannot start, the same brain runs in-process without the delay.
+    """
+    def __init__(self, workers=AI_WORKERS):
+        self.workers = workers
+        self.executor = None
+        if workers > 0:
+            try:
+                self.executor = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError):
+                self.executor = None
+        self.pending = []
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def jobs_for(self, bots, framecount):
+        jobs = []
+        for i, bot in enumerate(bots):
+            if bot.alive:
+                elapsed = max(1, framecount - bot.ai_decided_at)
+                jobs.append((bot, (i + 1, bot.ai_last_target, bot.ai_target_timer, elapsed)))
+        return jobs
+
+    def apply(self, bot, result, framecount):
+        target, avoid, boosting, bot.ai_last_target, bot.ai_target_timer = result
+        bot.ai_decided_at = framecount
+        bot.ai_cached = (target, avoid, boosting)
+        return bot.ai_cached
+
+    def decide(self, bots, player, food_items, framecount):
+        snakes = [(*s.body[0], s.length, s.alive) for s in [player] + bots]
+        food = food_items.snapshot()
+        jobs = self.jobs_for(bots, framecount)
+        if self.executor is None:
+            results = slither_brain.think(snakes, food, [job for _, job in jobs], random.random())
+            for (bot, _), result in zip(jobs, results):
+                yield bot, self.apply(bot, result, framecount)
+            return
+
+        ready = {}
+        for chunk, future in self.pending:
+            try:
+                results = future.result()
+            except Exception:
+                continue
+            for bot, result in zip(chunk, results):
+                ready[bot] = result
+        self.pending = []
+        size = max(1, math.ceil(len(jobs) / self.workers))
+        for start in range(0, len(jobs), size):
+            chunk = jobs[start:start + size]
+            future = self.executor.submit(slither_brain.think, snakes, food,
+                                          [job for _, job in chunk], random.random())
+            self.pending.append(([bot for bot, _ in chunk], future))
+        late = [(bot, job) for bot, job in jobs if bot not in ready]
+        if late:
+            # Bots new since last frame have no answer yet: decide them here
+            results = slither_brain.think(snakes, food, [job for _, job in late], random.random())
+            ready.update((bot, result) for (bot, _), result in zip(late, results))
+        for bot, _ in jobs:
+            yield bot, self.apply(bot, ready[bot], framecount)
+
+class World:
+    """One round of Local Slither.io: the snakes, the food and their indexes.
+
+    main() and the headless benchmark both advance it with step(); `now`
+    is passed in so a benchmark can run on a simulated clock.
+    """
+    def __init__(self, now):
         Snake.bot_counter = 0
-        player = Snake(BLUE, MAP_WIDTH // 2, MAP_HEIGHT // 2, name="You", face=random.choice(SNAKE_FACES))
-        player.is_bot = False
-        bots = []
+        self.arena = self.make_arena()
+        self.player = self.make_player()
+        self.bots = []
         for _ in range(BOT_COUNT):
-            bot = Snake.create_bot()
+            bot = self.spawn_bot()
+            bot.is_bot = True
+            self.bots.append(bot)
+        self.food_items = FoodField()
+        self.food_items.top_up(FOOD_COUNT)
+        self.segments = SegmentHash()
+        self.scheduler = self.make_scheduler()
+        self.last_bot_respawn = now
+
+    def make_arena(self):
+        return SnakeArena() if USE_ARENA and numpy is not None else None
+
+    def make_player(self):
+        face = random.choice(SNAKE_FACES)
+        if self.arena is not None:
+            player = ArenaSnake(BLUE, MAP_WIDTH // 2, MAP_HEIGHT // 2, name="You", face=face, arena=self.arena)
+        else:
+            player = Snake(BLUE, MAP_WIDTH // 2, MAP_HEIGHT // 2, name="You", face=face)
+        player.is_bot = False
+        return player
+
+    def make_scheduler(self):
+        return BotBrainPool() if AI_WORKERS > 0 else BotScheduler()
+
+    def spawn_bot(self):
+        if self.arena is not None:
+            return ArenaSnake.create_bot(arena=self.arena)
+        return Snake.create_bot()
+
+    def retire(self, bot):
+        # Called for each bot dropped from the round
+        if self.arena is not None:
+            self.arena.release(bot)
+
+    def update_bots(self, now):
+        bots = self.bots
+        dead_bots = [b for b in bots if not b.alive and getattr(b, "died_at", 0) > 0]
+        bots_to_respawn = [b for b in dead_bots if now - b.died_at >= BOT_RESPAWN_DELAY]
+        if bots_to_respawn:
+            bots_to_respawn[0].respawn()
+            bots_to_respawn[0].is_bot = True
+            bots_to_respawn[0].died_at = 0
+        kept = [b for b in bots if b.alive or (hasattr(b, "died_at") and now - b.died_at < 15)]
+        if len(kept) < len(bots):
+            kept_ids = {id(b) for b in kept}
+            for b in bots:
+                if id(b) not in kept_ids:
+                    self.retire(b)
+        bots[:] = kept
+        if len([b for b in bots if b.alive]) < BOT_COUNT and now - self.last_bot_respawn >= BOT_RESPAWN_DELAY:
+            bot = self.spawn_bot()
             bot.is_bot = True
             bots.append(bot)
-        food_items = [Food() for _ in range(FOOD_COUNT)]
-        return player, bots, food_items
+            self.last_bot_respawn = now
+
+    def step(self, now, framecount, target, boosting, avoid=None, phases=None):
+        player, bots, food_items, segments = self.player, self.bots, self.food_items, self.segments
+        picked = food_items.pickup_time
+        t0 = time.perf_counter()
+        player.update(target=target, boosting=boosting, food_items=food_items, avoid=avoid, segments=segments)
+        t1 = time.perf_counter()
+        self.update_bots(now)
+        decisions = list(self.scheduler.decide(bots, player, food_items, framecount))
+        t2 = time.perf_counter()
+        if self.arena is not None:
+            self.arena.step(decisions, food_items, segments)
+        else:
+            for bot, (bot_target, bot_avoid, bot_boost) in decisions:
+                bot.update(target=bot_target, food_items=food_items, avoid=bot_avoid, boosting=bot_boost, segments=segments)
+        t3 = time.perf_counter()
+        all_snakes = [player] + bots
+        for snake in all_snakes:
+            snake.check_collision(all_snakes, food_items, segments, now=now)
+        t4 = time.perf_counter()
+        food_items.top_up(FOOD_COUNT)
+        t5 = time.perf_counter()
+        if phases is not None:
+            # Pickup runs inside each snake's move; it counts as food, with the top-up
+            pickup = food_items.pickup_time - picked
+            phases["ai"] = phases.get("ai", 0) + (t2 - t1)
+            phases["move"] = phases.get("move", 0) + (t1 - t0) + (t3 - t2) - pickup
+            phases["collision"] = phases.get("collision", 0) + (t4 - t3)
+            phases["food"] = phases.get("food", 0) + (t5 - t4) + pickup
+
+    def close(self):
+        if isinstance(self.scheduler, BotBrainPool):
+            self.scheduler.close()
+
+    def draw(self, cam_offset):
+        camera = Camera(cam_offset)
+        camera.draw_food(self.food_items)
+        camera.draw_snakes([self.player] + self.bots, self.segments)
 
+def draw_background(bg_surface, cam_offset):
+    canvas = bg_surface.get_width()
+    bx = int(cam_offset[0] % (canvas-WIDTH))
+    by = int(cam_offset[1] % (canvas-HEIGHT))
+    screen.blit(bg_surface, (-bx, -by))
+
+def main():
     BG_CANVAS_SIZE = max(WIDTH, HEIGHT)*2
     bg_surface = create_gradient_bg(BG_CANVAS_SIZE, BG_CANVAS_SIZE)
 
     high_score = load_high_score()
-    player, bots, food_items = reset_game()
-    last_bot_respawn = time.time()
+    world = World(time.time())
+    minimap = Minimap()
     running = True
     paused = False
     game_over = False
@@ -374,60 +1199,247 @@ def main():
             if event.type == pygame.QUIT:
                 running = False
             elif game_over and event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                player, bots, food_items = reset_game()
+                world.close()
+                world = World(now)
                 game_over = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
                 paused = not paused
         if paused:
             continue
+        player = world.player
         cam_offset = [player.body[0][0] - WIDTH // 2, player.body[0][1] - HEIGHT // 2]
-        bx = int(cam_offset[0] % (BG_CANVAS_SIZE-WIDTH))
-        by = int(cam_offset[1] % (BG_CANVAS_SIZE-HEIGHT))
-        screen.blit(bg_surface, (-bx, -by))
+        draw_background(bg_surface, cam_offset)
         if not game_over:
             mx, my = pygame.mouse.get_pos()
             world_target = [player.body[0][0] - WIDTH // 2 + mx, player.body[0][1] - HEIGHT // 2 + my]
             boosting = pygame.mouse.get_pressed()[0]
-            player.update(target=world_target, boosting=boosting, food_items=food_items)
-            alive_bots = [b for b in bots if b.alive]
-            dead_bots = [b for b in bots if not b.alive and getattr(b, "died_at", 0) > 0]
-            bots_to_respawn = [b for b in dead_bots if now - b.died_at >= BOT_RESPAWN_DELAY]
-            if bots_to_respawn:
-                bots_to_respawn[0].respawn()
-                bots_to_respawn[0].is_bot = True
-                bots_to_respawn[0].died_at = 0
-            bots[:] = [b for b in bots if b.alive or (hasattr(b, "died_at") and now - b.died_at < 15)]
-            if len([b for b in bots if b.alive]) < BOT_COUNT and now - last_bot_respawn >= BOT_RESPAWN_DELAY:
-                bot = Snake.create_bot()
-                bot.is_bot = True
-                bots.append(bot)
-                last_bot_respawn = now
-            for bot in bots:
-                if not bot.alive:
-                    continue
-                target, avoid, boosting = bot_ai_decision(bot, bots, player, food_items, framecount)
-                bot.update(target=target, food_items=food_items, avoid=avoid, boosting=boosting)
-            all_snakes = [player] + bots
-            for snake in all_snakes:
-                snake.check_collision(all_snakes, food_items)
+            world.step(now, framecount, world_target, boosting)
             if not player.alive:
                 game_over = True
                 if player.score() > high_score:
                     high_score = player.score()
                     save_high_score(high_score)
-            while len(food_items) < FOOD_COUNT:
-                food_items.append(Food())
-        for food in food_items:
-            food.draw(offset=cam_offset)
-        player.draw(offset=cam_offset)
-        for bot in bots:
-            bot.draw(offset=cam_offset)
+        world.draw(cam_offset)
         if game_over:
             show_game_over()
         draw_score(player, high_score)
-        draw_minimap(player, bots)
+        minimap.draw(player, world.bots, now, world.food_items)
         pygame.display.flip()
+    world.close()
     pygame.quit()
 
+def benchmark_arena(argv):
+    # Headless, seeded run of the full game loop with per-phase timings
+    global BOT_COUNT, FOOD_COUNT, MAP_WIDTH, MAP_HEIGHT, USE_ARENA, AI_WORKERS
+    parser = argparse.ArgumentParser(prog="slither.py --bench", description="Headless slither arena benchmark")
+    parser.add_argument("--ticks", type=int, default=1200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bots", type=int, default=BOT_COUNT)
+    parser.add_argument("--food", type=int, default=FOOD_COUNT)
+    parser.add_argument("--map", default=f"{MAP_WIDTH}x{MAP_HEIGHT}", help="map size as WxH")
+    parser.add_argument("--player", choices=("ai", "script"), default="ai")
+    parser.add_argument("--no-draw", action="store_true", help="skip rendering entirely")
+    parser.add_argument("--arena", action="store_true", help="use the NumPy SnakeArena core")
+    parser.add_argument("--workers", type=int, default=AI_WORKERS, help="bot brain worker processes")
+    parser.add_argument("--minimap-hz", type=float, default=MINIMAP_HZ, help="minimap redraws per second (0: every frame)")
+    parser.add_argument("--heatmap", action="store_true", help="shade the minimap by food density")
+    args = parser.parse_args(argv)
+    BOT_COUNT, FOOD_COUNT = args.bots, args.food
+    MAP_WIDTH, MAP_HEIGHT = (int(v) for v in args.map.lower().split("x"))
+    USE_ARENA = args.arena
+    AI_WORKERS = args.workers
+
+    random.seed(args.seed)
+    world = World(0.0)
+    bg_surface = None if args.no_draw else create_gradient_bg(max(WIDTH, HEIGHT)*2, max(WIDTH, HEIGHT)*2)
+    minimap = Minimap(refresh_hz=args.minimap_hz, heatmap=args.heatmap)
+    phases = {}
+    frame_times = []
+    deaths = 0
+    start = time.perf_counter()
+    for tick in range(1, args.ticks + 1):
+        t0 = time.perf_counter()
+        now = tick / FPS
+        player = world.player
+        if not player.alive:
+            deaths += 1
+            player.respawn()
+        if args.player == "ai":
+            target, avoid, boosting = bot_ai_decision(player, world.bots, player, world.food_items, tick)
+        else:
+            # Circle around the current heading, boosting now and then
+            angle = tick * 0.02
+            hx, hy = player.body[0]
+            target, avoid, boosting = [hx + math.cos(angle) * 200, hy + math.sin(angle) * 200], None, tick % 240 < 30
+        world.step(now, tick, target, boosting, avoid=avoid, phases=phases)
+        if bg_surface is not None:
+            t1 = time.perf_counter()
+            cam_offset = [player.body[0][0] - WIDTH // 2, player.body[0][1] - HEIGHT // 2]
+            draw_background(bg_surface, cam_offset)
+            world.draw(cam_offset)
+            draw_score(player, 0)
+            t2 = time.perf_counter()
+            minimap.draw(player, world.bots, now, world.food_items)
+            t3 = time.perf_counter()
+            pygame.display.flip()
+            phases["draw"] = phases.get("draw", 0) + time.perf_counter() - t1
+            phases["minimap"] = phases.get("minimap", 0) + t3 - t2
+        frame_times.append(time.perf_counter() - t0)
+    total = time.perf_counter() - start
+    world.close()
+
+    frame_times.sort()
+    n = len(frame_times)
+    print(f"bots={BOT_COUNT} food={FOOD_COUNT} map={MAP_WIDTH}x{MAP_HEIGHT} seed={args.seed} "
+          f"player={args.player} draw={not args.no_draw} arena={world.arena is not None} workers={AI_WORKERS}")
+    print(f"ticks/s: {n / total:.1f}")
+    print(f"frame p50: {frame_times[n // 2] * 1000:.2f} ms  p99: {frame_times[int(0.99 * (n - 1))] * 1000:.2f} ms")
+    for name in ("ai", "move", "food", "collision", "draw", "minimap"):
+        if name in phases:
+            print(f"  {name:<9} {phases[name] / n * 1000:.3f} ms/tick")
+    alive = [b for b in world.bots if b.alive]
+    print(f"live bots: {len(alive)}  player deaths: {deaths}  food: {len(world.food_items)}  "
+          f"total length: {sum(b.length for b in alive):.1f}")
+
+def benchmark_workers(argv):
+    # The same seeded, undrawn world stepped with the bot brains in 0 (the
+    # in-process BotScheduler), 1, 2, 4 and cpu_count worker processes
+    global BOT_COUNT, FOOD_COUNT, AI_WORKERS
+    parser = argparse.ArgumentParser(prog="slither.py --bench-workers",
+                                     description="Bot step throughput across BotBrainPool worker counts")
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30, help="untimed ticks while the pool starts")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bots", type=int, default=100)
+    parser.add_argument("--food", type=int, default=FOOD_COUNT)
+    parser.add_argument("--workers", type=int, nargs="+", help="worker counts to run (default: 0 1 2 4 and the CPU count)")
+    args = parser.parse_args(argv)
+    BOT_COUNT, FOOD_COUNT = args.bots, args.food
+    counts = args.workers or sorted({0, 1, 2, 4, os.cpu_count() or 1})
+
+    print(f"bots={BOT_COUNT} food={FOOD_COUNT} ticks={args.ticks} seed={args.seed} cpus={os.cpu_count()}")
+    for workers in counts:
+        AI_WORKERS = workers
+        random.seed(args.seed)
+        world = World(0.0)
+        phases = {}
+        for tick in range(1, args.warmup + args.ticks + 1):
+            if tick == args.warmup + 1:
+                phases.clear()
+                start = time.perf_counter()
+            player = world.player
+            if not player.alive:
+                player.respawn()
+            # Scripted player, so only the bots think
+            angle = tick * 0.02
+            hx, hy = player.body[0]
+            world.step(tick / FPS, tick, [hx + math.cos(angle) * 200, hy + math.sin(angle) * 200], False, phases=phases)
+        total = time.perf_counter() - start
+        world.close()
+        print(f"workers {workers:3d}: {args.ticks / total:8.1f} ticks/s  ai {phases['ai'] / args.ticks * 1000:7.3f} ms/tick")
+
+def benchmark_background():
+    # Startup cost of the background: per-pixel baseline vs. array build vs. disk cache
+    size = max(WIDTH, HEIGHT) * 2
+    t0 = time.perf_counter()
+    vignette = pygame.Surface((size, size), pygame.SRCALPHA)
+    for y, row in enumerate(vignette_alpha_rows(size, size)):
+        for x, alpha in enumerate(row):
+            vignette.set_at((x, y), (0, 0, 0, alpha))
+    t1 = time.perf_counter()
+    build_gradient_bg(size, size)
+    t2 = time.perf_counter()
+    create_gradient_bg(size, size)
+    t3 = time.perf_counter()
+    create_gradient_bg(size, size)
+    t4 = time.perf_counter()
+    print(f"set_at vignette only: {(t1 - t0) * 1000:.0f} ms")
+    print(f"array build ({'numpy' if numpy is not None else 'pure python'}): {(t2 - t1) * 1000:.0f} ms")
+    print(f"build + cache write: {(t3 - t2) * 1000:.0f} ms")
+    print(f"cached load: {(t4 - t3) * 1000:.0f} ms")
+
+def benchmark_body(ticks=20000, repeats=15):
+    # One tick of movement as Snake.update does it: read the head, push a
+    # new one, drop the tail. Best of several runs, since a single run at
+    # these timings is mostly scheduler noise
+    def old(length):
+        body = [[0.0, float(i)] for i in range(length)]
+        t0 = time.perf_counter()
+        for _ in range(ticks):
+            head = body[0][:]
+            body.insert(0, [head[0] + 1.0, head[1]])
+            if len(body) > length:
+                body.pop()
+        return time.perf_counter() - t0
+    def ring(length):
+        body = SnakeBody(0.0, 0.0)
+        body.extend((0.0, float(i)) for i in range(1, length))
+        t0 = time.perf_counter()
+        for _ in range(ticks):
+            x, y = body[0]
+            body.appendleft((x + 1.0, y))
+            body.serial += 1
+            if len(body) > length:
+                tx, ty = body.pop()
+        return time.perf_counter() - t0
+    for length in (10, 50, 200, 500, 5000):
+        t_old = min(old(length) for _ in range(repeats))
+        t_ring = min(ring(length) for _ in range(repeats))
+        print(f"length {length:5d}: list {t_old / ticks * 1e9:7.0f} ns/tick, "
+              f"ring {t_ring / ticks * 1e9:7.0f} ns/tick")
+
+def benchmark_food(rounds=200, drop=2000):
+    # A big snake dies and its drop gets eaten, over and over: one object
+    # per food item in a grid-indexed dict (the old FoodField) vs the pool
+    import gc
+    import tracemalloc
+    class ObjectFood:
+        def __init__(self, pos, color):
+            self.pos = list(pos)
+            self.color = color
+    def objects():
+        grid, items, cells = WrapGrid(FOOD_CELL_SIZE), {}, {}
+        for _ in range(rounds):
+            for seg in body:
+                food = ObjectFood(seg, color)
+                cell = items[food] = grid.cell_of(*food.pos)
+                cells.setdefault(cell, set()).add(food)
+            for food in list(items):
+                cells[items.pop(food)].discard(food)
+    def pool():
+        field = FoodField(capacity=drop)
+        color_id = Food.color_id(color)
+        for _ in range(rounds):
+            for x, y in body:
+                field.spawn(x, y, color_id)
+            for slot in list(field):
+                field.remove(slot)
+    body = [(float(i * 3), float(i * 2)) for i in range(drop)]
+    color = BOT_COLORS[0]
+    for name, run in (("objects", objects), ("pool", pool)):
+        gc.collect()
+        collections = sum(stat["collections"] for stat in gc.get_stats())
+        t0 = time.perf_counter()
+        run()
+        t1 = time.perf_counter()
+        collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>7}: {(t1 - t0) / rounds * 1000:.2f} ms per {drop}-segment drop, "
+              f"{collections} gc collections, peak traced {peak / 1024:.0f} KiB")
+
 if __name__ == '__main__':
-    main()
+    if "--bench-bg" in sys.argv:
+        benchmark_background()
+    elif "--bench-body" in sys.argv:
+        benchmark_body()
+    elif "--bench-food" in sys.argv:
+        benchmark_food()
+    elif "--bench-workers" in sys.argv:
+        benchmark_workers([arg for arg in sys.argv[1:] if arg != "--bench-workers"])
+    elif "--bench" in sys.argv:
+        benchmark_arena([arg for arg in sys.argv[1:] if arg != "--bench"])
+    else:
+        main()
@@ -0,0 +1,104 @@
+"""Bot brains for slither.py, run over compact world snapshots.
+
+This module does not import pygame, so worker processes can load it
+without opening a window. A snapshot is plain tuples:
+snakes = [(x, y, length, alive), ...] and food is a FoodCells of
+(x, y) positions bucketed by the FoodField grid.
+"""
+import math
+import random
+from collections import namedtuple
+
+# dims: the grid's (cols, rows, cell_w, cell_h); cells: cell id -> items
+FoodCells = namedtuple("FoodCells", "dims cells count")
+
+
+def nearest_food(x, y, food, pos=None):
+    """Nearest item to (x, y) by straight-line distance, as a min() over all
+    of them would pick, searching square rings of cells outward from (x, y).
+
+    pos maps an item to its (x, y); None means items are positions. Where
+    food is so sparse that the rings would take more cell lookups than
+    there are items, it scans every bucket instead.
+    """
+    cols, rows, cell_w, cell_h = food.dims
+    cells = food.cells
+    cx, cy = int(x // cell_w), int(y // cell_h)
+    best, best_d = None, math.inf
+    looked = 0
+    r = 0
+    # Spread evenly, finding the nearest item takes about cols * rows / count
+    # cell lookups; past count of them a plain scan is cheaper
+    while cols * rows < food.count * food.count:
+        if r == 0:
+            ring = ((cx, cy),)
+        else:
+            ring = [(cx + d, cy - r) for d in range(-r, r + 1)]
+            ring += [(cx + d, cy + r) for d in range(-r, r + 1)]
+            ring += [(cx - r, cy + d) for d in range(1 - r, r)]
+            ring += [(cx + r, cy + d) for d in range(1 - r, r)]
+        looked += len(ring)
+        if looked > food.count:
+            break
+        for col, row in ring:
+            for item in cells.get(col % cols + (row % rows) * cols, ()):
+                fx, fy = item if pos is None else pos(item)
+                d = math.hypot(fx - x, fy - y)
+                if d < best_d:
+                    best, best_d = item, d
+        # Anything not looked at yet lies outside the square searched so far
+        reach = min(x - (cx - r) * cell_w, (cx + r + 1) * cell_w - x,
+                    y - (cy - r) * cell_h, (cy + r + 1) * cell_h - y)
+        if best_d <= reach or (cx - r <= 0 and cy - r <= 0 and cx + r >= cols - 1 and cy + r >= rows - 1):
+            return best
+        r += 1
+    best, best_d = None, math.inf
+    for bucket in cells.values():
+        for item in bucket:
+            fx, fy = item if pos is None else pos(item)
+            d = math.hypot(fx - x, fy - y)
+            if d < best_d:
+                best, best_d = item, d
+    return best
+
+
+def decide(me, snakes, food, last_target, timer, elapsed, rng):
+    # Same rules as slither.bot_ai_decision, on snapshot tuples
+    hx, hy, length, _ = snakes[me]
+    avoid = None
+    threat_dist = 70 + length
+    min_dist = 999999
+    prey = None
+    prey_dist = 99999999
+    for i, (ox, oy, other_length, alive) in enumerate(snakes):
+        if i == me or not alive:
+            continue
+        d = math.hypot(hx - ox, hy - oy)
+        if other_length > length + 4 and d < threat_dist and d < min_dist:
+            avoid, min_dist = (ox, oy), d
+        if other_length <= length + 8 and d < 180 and d < prey_dist:
+            prey, prey_dist = (ox, oy), d
+    if prey and length > 15:
+        target = prey
+        boosting = True
+    elif food.count:
+        target = nearest_food(hx, hy, food)
+        boosting = (length > 20) and rng.random() < 0.10
+    else:
+        target = None
+        boosting = False
+
+    if last_target and timer > 0:
+        target = last_target
+        timer -= elapsed
+    else:
+        last_target = target
+        timer = rng.randint(8, 20)
+    return target, avoid, boosting, last_target, timer
+
+
+def think(snakes, food, jobs, seed):
+    # jobs: [(snake index, last_target, timer, elapsed)]; runs in a worker
+    rng = random.Random(seed)
+    return [decide(me, snakes, food, last_target, timer, elapsed, rng)
+            for me, last_target, timer, elapsed in jobs]
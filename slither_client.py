@@ -0,0 +1,114 @@
+"""Thin pygame client for slither_server.py.
+
+Sends the mouse heading and boost button, mirrors the server's snapshots
+with slither_net.ClientState and draws them with slither.py's sprites.
+
+    python slither_client.py [--host 127.0.0.1] [--port 7777] [--name You]
+"""
+import argparse
+import asyncio
+import time
+
+import pygame
+
+import slither
+import slither_net as net
+from slither import WIDTH, HEIGHT, screen, small_font, font
+
+INPUT_EPSILON = 0.01  # radians; smaller heading changes are not sent
+
+
+async def receive(reader, state):
+    while True:
+        payload = await net.read_frame(reader)
+        if payload[:1] == net.MSG_SNAPSHOT:
+            state.apply(payload)
+
+
+def draw_state(state, cam):
+    q = net.QUANT
+    map_w, map_h = state.qw / q, state.qh / q
+    left, top = 40 - cam[0], 40 - cam[1]
+    right, bottom = WIDTH + 80, HEIGHT + 80
+    for qx, qy, color in state.food.values():
+        sx = (qx / q + left) % map_w
+        sy = (qy / q + top) % map_h
+        if sx < right and sy < bottom:
+            glow = slither.Food.surface_cache[slither.Food.color_id(color)]
+            screen.blit(glow, glow.get_rect(center=(int(sx - 40), int(sy - 40))))
+    r = slither.SNAKE_RADIUS
+    for snake in state.snakes.values():
+        atlas = slither.Snake.atlas_cache.get(snake["color"])
+        if atlas is None:
+            atlas = slither.Snake.atlas_cache[snake["color"]] = slither.make_segment_atlas(snake["color"])
+        last = len(atlas) - 1
+        face_surf = slither.render_face(slither.SNAKE_FACES[snake["face"] % len(slither.SNAKE_FACES)])
+        batch = []
+        for segi, (qx, qy) in enumerate(snake["body"]):
+            sx = (qx / q + left) % map_w
+            sy = (qy / q + top) % map_h
+            if sx < right and sy < bottom:
+                screenx, screeny = int(sx - 40), int(sy - 40)
+                batch.append((atlas[segi if segi < last else last], (screenx - r, screeny - r)))
+                if segi == 0:
+                    batch.append((face_surf, face_surf.get_rect(center=(screenx, screeny))))
+        screen.blits(batch, doreturn=False)
+
+
+async def play(host, port, name):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(net.encode_join(name))
+    map_w, map_h, tick_rate, snapshot_rate = net.decode_welcome(await net.read_frame(reader))
+    state = net.ClientState(map_w, map_h)
+    receiver = asyncio.ensure_future(receive(reader, state))
+    canvas = max(WIDTH, HEIGHT) * 2
+    bg_surface = slither.create_gradient_bg(canvas, canvas)
+    cam = [0, 0]
+    sent = (None, None)
+    frame_time = 1 / slither.FPS
+    try:
+        while not receiver.done():
+            started = time.perf_counter()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+            head = state.head()
+            if head is not None:
+                cam = [head[0] - WIDTH // 2, head[1] - HEIGHT // 2]
+                mx, my = pygame.mouse.get_pos()
+                angle = net.angle_between(WIDTH // 2, HEIGHT // 2, mx, my)
+                boosting = bool(pygame.mouse.get_pressed()[0])
+                if sent[0] is None or abs(angle - sent[0]) > INPUT_EPSILON or boosting != sent[1]:
+                    writer.write(net.encode_input(angle, boosting))
+                    sent = (angle, boosting)
+            slither.draw_background(bg_surface, cam)
+            draw_state(state, cam)
+            label = f"Score: {state.score}  Tick: {state.tick}  Snakes in view: {len(state.snakes)}"
+            screen.blit(small_font.render(label, True, slither.WHITE), (10, 10))
+            if head is None:
+                text = font.render("Respawning...", True, slither.YELLOW)
+                screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
+            pygame.display.set_caption(f"Local Slither.io - {host}:{port}")
+            pygame.display.flip()
+            await asyncio.sleep(max(0.0, frame_time - (time.perf_counter() - started)))
+        receiver.result()  # surface a dropped connection
+    finally:
+        receiver.cancel()
+        writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local Slither.io network client")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--name", default="You")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(play(args.host, args.port, args.name))
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        print(f"disconnected: {e}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Load test for slither_server.py: hundreds of simulated players on localhost.
+
+Each simulated player connects over TCP, random-walks its heading, boosts
+now and then, and decodes every snapshot with the same ClientState the
+pygame client uses. The server prints tick times (--stats); this script
+reports the downstream bandwidth and snapshot sizes seen per player.
+
+    python slither_loadtest.py [--clients 200] [--seconds 30] [--port 7777]
+        [--spawn-server] [--ramp 5]
+"""
+import argparse
+import asyncio
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+
+import slither_net as net
+
+
+class Player:
+    def __init__(self, index):
+        self.index = index
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.snapshots = 0
+        self.sizes = []
+        self.error = None
+
+
+async def simulate(player, host, port, deadline, rng):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError as e:
+        player.error = e
+        return
+    writer.write(net.encode_join(f"load{player.index}"))
+    try:
+        payload = await net.read_frame(reader)
+        map_w, map_h, _, _ = net.decode_welcome(payload)
+        state = net.ClientState(map_w, map_h)
+        angle = rng.uniform(-math.pi, math.pi)
+        next_input = 0.0
+        while time.monotonic() < deadline:
+            remaining = deadline - time.monotonic()
+            try:
+                payload = await asyncio.wait_for(net.read_frame(reader), timeout=max(0.01, remaining))
+            except asyncio.TimeoutError:
+                break
+            player.bytes_in += net.HEADER.size + len(payload)
+            if payload[:1] == net.MSG_SNAPSHOT:
+                state.apply(payload)
+                player.snapshots += 1
+                player.sizes.append(net.HEADER.size + len(payload))
+            now = time.monotonic()
+            if now >= next_input:
+                angle += rng.uniform(-0.6, 0.6)
+                data = net.encode_input(angle, rng.random() < 0.1)
+                writer.write(data)
+                player.bytes_out += len(data)
+                next_input = now + 0.1
+    except (ConnectionError, asyncio.IncompleteReadError, KeyError, IndexError) as e:
+        # KeyError/IndexError: a delta for a snake we never saw, i.e. a protocol bug
+        player.error = e
+    finally:
+        writer.close()
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    players = [Player(i) for i in range(args.clients)]
+    deadline = time.monotonic() + args.ramp + args.seconds
+    tasks = []
+    for player in players:
+        tasks.append(asyncio.ensure_future(simulate(player, args.host, args.port, deadline,
+                                                    random.Random(rng.random()))))
+        await asyncio.sleep(args.ramp / max(1, args.clients))
+    await asyncio.gather(*tasks)
+    return players
+
+
+def report(players, seconds):
+    ok = [p for p in players if p.error is None and p.snapshots]
+    failed = [p for p in players if p.error is not None]
+    sizes = sorted(s for p in ok for s in p.sizes)
+    print(f"clients: {len(players)}  ok: {len(ok)}  failed: {len(failed)}")
+    for p in failed[:5]:
+        print(f"  load{p.index}: {type(p.error).__name__}: {p.error}")
+    if not ok:
+        return
+    down = sorted(p.bytes_in / seconds / 1024 for p in ok)
+    n = len(down)
+    print(f"down per player: mean {sum(down) / n:.2f} KiB/s  p50 {down[n // 2]:.2f}  max {down[-1]:.2f}")
+    print(f"up per player: {sum(p.bytes_out for p in ok) / n / seconds:.0f} B/s")
+    print(f"snapshots per player: {sum(p.snapshots for p in ok) / n / seconds:.1f}/s  "
+          f"size p50 {sizes[len(sizes) // 2]} B  p99 {sizes[int(0.99 * (len(sizes) - 1))]} B  max {sizes[-1]} B")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test for slither_server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=30.0, help="measured run after the ramp")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which clients connect")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--spawn-server", action="store_true", help="start slither_server.py for the run")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.spawn_server:
+        here = os.path.dirname(os.path.abspath(__file__))
+        server = subprocess.Popen([sys.executable, os.path.join(here, "slither_server.py"),
+                                   "--host", args.host, "--port", str(args.port), "--seed", str(args.seed)])
+        time.sleep(2.0)
+    try:
+        players = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    report(players, args.ramp + args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Wire protocol for networked Local Slither.io.
+
+Frames are a 4-byte little-endian length followed by a payload whose first
+byte is the message type. Positions are quantized to quarter pixels; snake
+bodies travel as one absolute head plus int8 steps between segments, and
+after the first snapshot only the new heads and the current body length are
+sent. Nothing here imports pygame, so load tests stay lightweight.
+"""
+import math
+import struct
+from collections import deque
+
+QUANT = 4  # quarter-pixel positions
+NO_SNAKE = 0xFFFF
+
+MSG_JOIN = b"J"
+MSG_INPUT = b"I"
+MSG_WELCOME = b"W"
+MSG_SNAPSHOT = b"S"
+
+SNAKE_FULL = 0
+SNAKE_DELTA = 1
+
+HEADER = struct.Struct("<I")
+WELCOME = struct.Struct("<IIHH")
+INPUT = struct.Struct("<hB")
+SNAP_HEAD = struct.Struct("<IHH")
+SNAKE_HEAD = struct.Struct("<HBH")
+FULL_HEAD = struct.Struct("<3BBB")
+POINT = struct.Struct("<II")
+FOOD = struct.Struct("<III3B")
+
+
+def frame(payload):
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader):
+    size, = HEADER.unpack(await reader.readexactly(HEADER.size))
+    return await reader.readexactly(size)
+
+
+def quantize(x, y, qw, qh):
+    return int(x * QUANT) % qw, int(y * QUANT) % qh
+
+
+def wrap_step(d, size):
+    return (d + size // 2) % size - size // 2
+
+
+def encode_join(name):
+    return frame(MSG_JOIN + name.encode("utf-8")[:32])
+
+
+def encode_input(angle, boosting):
+    angle = math.remainder(angle, 2 * math.pi)  # fits the int16 field
+    return frame(MSG_INPUT + INPUT.pack(int(angle * 10000), 1 if boosting else 0))
+
+
+def decode_input(payload):
+    angle, boosting = INPUT.unpack_from(payload, 1)
+    return angle / 10000, bool(boosting)
+
+
+def encode_welcome(map_w, map_h, tick_rate, snapshot_rate):
+    return frame(MSG_WELCOME + WELCOME.pack(map_w, map_h, tick_rate, snapshot_rate))
+
+
+def decode_welcome(payload):
+    return WELCOME.unpack_from(payload, 1)
+
+
+class SnapshotWriter:
+    """Builds one snapshot payload for one client."""
+    def __init__(self, tick, me, score, map_w, map_h):
+        self.qw, self.qh = map_w * QUANT, map_h * QUANT
+        self.parts = [MSG_SNAPSHOT, SNAP_HEAD.pack(tick, me, min(score, 0xFFFF))]
+        self.removed = []
+        self.snakes = []
+        self.food_removed = []
+        self.food_added = []
+
+    def full_snake(self, net_id, color, face, name, body):
+        # body: (x, y) head first
+        points = [quantize(x, y, self.qw, self.qh) for x, y in body]
+        name = name.encode("utf-8")[:32]
+        out = [SNAKE_HEAD.pack(net_id, SNAKE_FULL, len(points)),
+               FULL_HEAD.pack(*color[:3], face, len(name)), name, POINT.pack(*points[0])]
+        steps = bytearray()
+        for (px, py), (x, y) in zip(points, points[1:]):
+            steps += struct.pack("<bb", wrap_step(x - px, self.qw), wrap_step(y - py, self.qh))
+        out.append(bytes(steps))
+        self.snakes.append(b"".join(out))
+        return points[0]
+
+    def delta_snake(self, net_id, length, last_head, new_heads):
+        # new_heads: oldest first; each step is relative to the previous head
+        steps = bytearray([len(new_heads)])
+        px, py = last_head
+        for x, y in new_heads:
+            qx, qy = quantize(x, y, self.qw, self.qh)
+            steps += struct.pack("<bb", wrap_step(qx - px, self.qw), wrap_step(qy - py, self.qh))
+            px, py = qx, qy
+        self.snakes.append(SNAKE_HEAD.pack(net_id, SNAKE_DELTA, length) + bytes(steps))
+        return px, py
+
+    def encode(self):
+        parts = self.parts
+        parts.append(struct.pack("<H", len(self.removed)))
+        parts.append(struct.pack(f"<{len(self.removed)}H", *self.removed))
+        parts.append(struct.pack("<H", len(self.snakes)))
+        parts.extend(self.snakes)
+        parts.append(struct.pack("<H", len(self.food_removed)))
+        parts.append(struct.pack(f"<{len(self.food_removed)}I", *self.food_removed))
+        parts.append(struct.pack("<H", len(self.food_added)))
+        for food_id, x, y, color in self.food_added:
+            qx, qy = quantize(x, y, self.qw, self.qh)
+            parts.append(FOOD.pack(food_id, qx, qy, *color[:3]))
+        return frame(b"".join(parts))
+
+
+class ClientState:
+    """Client-side mirror of everything inside this client's area of interest."""
+    def __init__(self, map_w, map_h):
+        self.qw, self.qh = map_w * QUANT, map_h * QUANT
+        self.tick = 0
+        self.me = NO_SNAKE
+        self.score = 0
+        self.snakes = {}
+        self.food = {}
+
+    def apply(self, payload):
+        self.tick, self.me, self.score = SNAP_HEAD.unpack_from(payload, 1)
+        at = 1 + SNAP_HEAD.size
+        count, = struct.unpack_from("<H", payload, at)
+        at += 2
+        for net_id in struct.unpack_from(f"<{count}H", payload, at):
+            self.snakes.pop(net_id, None)
+        at += 2 * count
+        count, = struct.unpack_from("<H", payload, at)
+        at += 2
+        for _ in range(count):
+            net_id, kind, length = SNAKE_HEAD.unpack_from(payload, at)
+            at += SNAKE_HEAD.size
+            if kind == SNAKE_FULL:
+                r, g, b, face, name_len = FULL_HEAD.unpack_from(payload, at)
+                at += FULL_HEAD.size
+                name = payload[at:at + name_len].decode("utf-8", "replace")
+                at += name_len
+                qx, qy = POINT.unpack_from(payload, at)
+                at += POINT.size
+                body = deque([(qx, qy)])
+                for dx, dy in struct.iter_unpack("<bb", payload[at:at + 2 * (length - 1)]):
+                    qx, qy = (qx + dx) % self.qw, (qy + dy) % self.qh
+                    body.append((qx, qy))
+                at += 2 * (length - 1)
+                self.snakes[net_id] = {"color": (r, g, b), "face": face, "name": name, "body": body}
+            else:
+                snake = self.snakes[net_id]
+                body = snake["body"]
+                steps = payload[at]
+                at += 1
+                qx, qy = body[0]
+                for dx, dy in struct.iter_unpack("<bb", payload[at:at + 2 * steps]):
+                    qx, qy = (qx + dx) % self.qw, (qy + dy) % self.qh
+                    body.appendleft((qx, qy))
+                at += 2 * steps
+                while len(body) > length:
+                    body.pop()
+        count, = struct.unpack_from("<H", payload, at)
+        at += 2
+        for food_id in struct.unpack_from(f"<{count}I", payload, at):
+            self.food.pop(food_id, None)
+        at += 4 * count
+        count, = struct.unpack_from("<H", payload, at)
+        at += 2
+        for _ in range(count):
+            food_id, qx, qy, r, g, b = FOOD.unpack_from(payload, at)
+            at += FOOD.size
+            self.food[food_id] = (qx, qy, (r, g, b))
+
+    def head(self):
+        snake = self.snakes.get(self.me)
+        if snake is None:
+            return None
+        qx, qy = snake["body"][0]
+        return qx / QUANT, qy / QUANT
+
+
+def angle_between(x0, y0, x1, y1):
+    return math.atan2(y1 - y0, x1 - x0)
@@ -0,0 +1,377 @@
+"""Authoritative asyncio server for networked Local Slither.io.
+
+Runs the slither.py simulation at a fixed tick rate for every connected
+player plus the usual bots. Each client gets a quantized, delta-compressed
+snapshot of its own area of interest (see slither_net) every few ticks.
+Clients connect over TCP, or over WebSocket when the websockets package
+is installed; a WebSocket message carries exactly one frame.
+
+    python slither_server.py [--port 7777] [--ws-port 7778] [--tick-rate 60]
+        [--snapshot-rate 30] [--bots N] [--food N] [--map WxH] [--stats S]
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # the server never draws
+os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")  # let SIGTERM stop it
+
+import argparse
+import asyncio
+import math
+import random
+import time
+
+import slither
+import slither_net as net
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+AOI_WIDTH, AOI_HEIGHT = 1400, 1200  # area of interest around each player's head
+AOI_CELL_SIZE = 512
+AOI_SAMPLE = 32  # every AOI_SAMPLE-th segment places a snake in the AOI grid
+HUMAN_RESPAWN_DELAY = 2.0
+STEER_REACH = 100  # inputs are headings; steer toward a point this far ahead
+MAX_BACKLOG = 256 * 1024  # a client this many bytes behind skips snapshots
+
+CLOSED = (asyncio.IncompleteReadError, ConnectionError)
+if websockets is not None:
+    CLOSED += (websockets.exceptions.ConnectionClosed,)
+
+
+class TcpLink:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def recv(self):
+        return await net.read_frame(self.reader)
+
+    def send(self, data):
+        self.writer.write(data)
+
+    def backlog(self):
+        return self.writer.transport.get_write_buffer_size()
+
+    def close(self):
+        self.writer.close()
+
+
+class WebSocketLink:
+    def __init__(self, ws):
+        self.ws = ws
+        self.outbox = asyncio.Queue()
+        self.queued = 0
+        self.pump = asyncio.ensure_future(self.drain())
+
+    async def drain(self):
+        while True:
+            data = await self.outbox.get()
+            try:
+                await self.ws.send(data)
+            except CLOSED:
+                return
+            self.queued -= len(data)
+
+    async def recv(self):
+        data = await self.ws.recv()
+        return data[net.HEADER.size:]
+
+    def send(self, data):
+        self.queued += len(data)
+        self.outbox.put_nowait(data)
+
+    def backlog(self):
+        return self.queued
+
+    def close(self):
+        self.pump.cancel()
+
+
+class Client:
+    """One connected player: its link, its snake and what it already knows."""
+    def __init__(self, link, snake):
+        self.link = link
+        self.snake = snake
+        self.angle = random.uniform(-math.pi, math.pi)
+        self.boosting = False
+        self.focus = snake.body[0]
+        self.known = {}  # snake -> (body, serial, quantized head, segment count)
+        self.food = set()  # net ids of the food the client holds
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+
+class AOIGrid:
+    """Coarse map of which snakes and food lie where, built once per snapshot
+    round and shared by every client's area-of-interest query."""
+    def __init__(self, snakes, food_items):
+        self.grid = slither.WrapGrid(AOI_CELL_SIZE)
+        self.snakes = {}
+        self.food = {}
+        cell_of = self.grid.cell_of
+        for snake in snakes:
+            if not snake.alive:
+                continue
+            body = snake.body
+            count = len(body)
+            for i in list(range(0, count, AOI_SAMPLE)) + [count - 1]:
+                self.snakes.setdefault(cell_of(*body[i]), set()).add(snake)
+        xs, ys = food_items.x, food_items.y
+        for slot in food_items:
+            self.food.setdefault(cell_of(xs[slot], ys[slot]), []).append(slot)
+        self.food_items = food_items
+
+    def query(self, x, y):
+        # food: net id (the pool's spawn serial) -> slot
+        snakes, food = set(), {}
+        serial = self.food_items.serial
+        cells = self.grid.cells_in_rect(x - AOI_WIDTH / 2, y - AOI_HEIGHT / 2,
+                                        x + AOI_WIDTH / 2, y + AOI_HEIGHT / 2)
+        for cell in cells:
+            snakes.update(self.snakes.get(cell, ()))
+            for slot in self.food.get(cell, ()):
+                food[serial[slot]] = slot
+        return snakes, food
+
+
+class ServerWorld(slither.World):
+    """A World with any number of human snakes and no local player."""
+    def __init__(self, now):
+        self.humans = []
+        self.free_ids = list(range(net.NO_SNAKE - 1, -1, -1))
+        super().__init__(now)
+
+    def make_arena(self):
+        return None
+
+    def make_player(self):
+        return None
+
+    def make_scheduler(self):
+        return slither.BotScheduler()
+
+    def spawn_bot(self):
+        bot = slither.Snake.create_bot()
+        bot.net_id = self.free_ids.pop()
+        return bot
+
+    def retire(self, bot):
+        self.free_ids.append(bot.net_id)
+
+    def add_human(self, name):
+        color = slither.get_unique_bot_color(len(slither.BOT_COLORS) + len(self.humans))
+        snake = slither.Snake(color, 0, 0, name=name or "Player")
+        snake.respawn()
+        snake.is_bot = False
+        snake.net_id = self.free_ids.pop()
+        self.humans.append(snake)
+        return snake
+
+    def remove_human(self, snake):
+        self.humans.remove(snake)
+        self.segments.untrack(snake)
+        snake.alive = False
+        self.free_ids.append(snake.net_id)
+
+    def step(self, now, framecount, steering):
+        # steering: human snake -> (target, boosting)
+        food_items, segments = self.food_items, self.segments
+        for snake in self.humans:
+            if not snake.alive:
+                if now - snake.died_at >= HUMAN_RESPAWN_DELAY:
+                    snake.respawn()
+                continue
+            target, boosting = steering[snake]
+            snake.update(target=target, boosting=boosting, food_items=food_items, segments=segments)
+        self.update_bots(now)
+        decisions = list(self.scheduler.decide(self.bots, None, food_items, framecount, others=self.humans))
+        for bot, (bot_target, bot_avoid, bot_boost) in decisions:
+            bot.update(target=bot_target, food_items=food_items, avoid=bot_avoid, boosting=bot_boost, segments=segments)
+        all_snakes = self.humans + self.bots
+        for snake in all_snakes:
+            snake.check_collision(all_snakes, food_items, segments, now=now)
+        food_items.top_up(slither.FOOD_COUNT)
+
+
+class SlitherServer:
+    def __init__(self, tick_rate, snapshot_rate, stats_every=0.0):
+        self.tick_rate = tick_rate
+        self.snapshot_rate = snapshot_rate
+        self.snapshot_every = max(1, round(tick_rate / snapshot_rate))
+        self.stats_every = stats_every
+        self.world = ServerWorld(time.monotonic())
+        self.clients = []
+        self.tick = 0
+        self.tick_times = []
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+    async def serve_link(self, link):
+        client = None
+        try:
+            payload = await link.recv()
+            if payload[:1] != net.MSG_JOIN:
+                return
+            snake = self.world.add_human(payload[1:].decode("utf-8", "replace"))
+            client = Client(link, snake)
+            self.clients.append(client)
+            link.send(net.encode_welcome(slither.MAP_WIDTH, slither.MAP_HEIGHT,
+                                         self.tick_rate, self.snapshot_rate))
+            while True:
+                payload = await link.recv()
+                client.bytes_in += net.HEADER.size + len(payload)
+                if payload[:1] == net.MSG_INPUT:
+                    client.angle, client.boosting = net.decode_input(payload)
+        except CLOSED:
+            pass
+        finally:
+            if client is not None:
+                self.clients.remove(client)
+                self.world.remove_human(client.snake)
+                self.bytes_in += client.bytes_in
+                self.bytes_out += client.bytes_out
+            link.close()
+
+    async def serve_tcp(self, reader, writer):
+        await self.serve_link(TcpLink(reader, writer))
+
+    async def serve_websocket(self, ws, *_):
+        await self.serve_link(WebSocketLink(ws))
+
+    def steering(self):
+        steering = {}
+        for client in self.clients:
+            hx, hy = client.snake.body[0]
+            target = [hx + math.cos(client.angle) * STEER_REACH, hy + math.sin(client.angle) * STEER_REACH]
+            steering[client.snake] = (target, client.boosting)
+        return steering
+
+    def snapshot(self, client, aoi):
+        snake = client.snake
+        if snake.alive:
+            client.focus = snake.body[0]
+        me = snake.net_id if snake.alive else net.NO_SNAKE
+        writer = net.SnapshotWriter(self.tick, me, snake.score(), slither.MAP_WIDTH, slither.MAP_HEIGHT)
+        visible, food = aoi.query(*client.focus)
+        if snake.alive:
+            visible.add(snake)
+        known = client.known
+        for other in list(known):
+            if other not in visible or not other.alive:
+                writer.removed.append(other.net_id)
+                del known[other]
+        for other in visible:
+            if not other.alive:
+                continue
+            body = other.body
+            count = len(body)
+            seen = known.get(other)
+            steps = body.serial - seen[1] if seen is not None else 0
+            if seen is None or seen[0] is not body or steps > 255 or steps >= count:
+                head = writer.full_snake(other.net_id, other.color, slither.SNAKE_FACES.index(other.face),
+                                         other.name, body)
+            elif steps or count != seen[3]:
+                head = writer.delta_snake(other.net_id, count, seen[2],
+                                          [body[i] for i in range(steps - 1, -1, -1)])
+            else:
+                continue
+            known[other] = (body, body.serial, head, count)
+        held = client.food
+        for food_id in held - food.keys():
+            writer.food_removed.append(food_id)
+        pool = self.world.food_items
+        for food_id in food.keys() - held:
+            slot = food[food_id]
+            writer.food_added.append((food_id, pool.x[slot], pool.y[slot], slither.Food.palette[pool.color[slot]]))
+        client.food = set(food)
+        return writer.encode()
+
+    def broadcast(self):
+        aoi = AOIGrid(self.world.humans + self.world.bots, self.world.food_items)
+        for client in self.clients:
+            if client.link.backlog() > MAX_BACKLOG:
+                # Too far behind: skip this round; the next delta covers the gap
+                continue
+            data = self.snapshot(client, aoi)
+            client.bytes_out += len(data)
+            client.link.send(data)
+
+    def report(self, elapsed):
+        times = sorted(self.tick_times)
+        self.tick_times = []
+        n = len(times)
+        if not n:
+            return
+        players = len(self.clients)
+        out = sum(c.bytes_out for c in self.clients) + self.bytes_out
+        inbound = sum(c.bytes_in for c in self.clients) + self.bytes_in
+        per_player = out / elapsed / players / 1024 if players else 0.0
+        print(f"players={players} bots={sum(b.alive for b in self.world.bots)} ticks/s={n / elapsed:.1f} "
+              f"tick p50={times[n // 2] * 1000:.2f} ms p99={times[int(0.99 * (n - 1))] * 1000:.2f} ms "
+              f"max={times[-1] * 1000:.2f} ms  out={out / elapsed / 1024:.1f} KiB/s "
+              f"({per_player:.2f} KiB/s/player)  in={inbound / elapsed / 1024:.1f} KiB/s", flush=True)
+        for client in self.clients:
+            client.bytes_out = client.bytes_in = 0
+        self.bytes_out = self.bytes_in = 0
+
+    async def run(self):
+        period = 1 / self.tick_rate
+        next_at = last_report = time.perf_counter()
+        while True:
+            t0 = time.perf_counter()
+            self.tick += 1
+            self.world.step(time.monotonic(), self.tick, self.steering())
+            if self.tick % self.snapshot_every == 0:
+                self.broadcast()
+            t1 = time.perf_counter()
+            self.tick_times.append(t1 - t0)
+            if self.stats_every and t1 - last_report >= self.stats_every:
+                self.report(t1 - last_report)
+                last_report = t1
+            next_at += period
+            if next_at < t1:
+                # Overran the budget: run late rather than in a catch-up burst
+                next_at = t1
+            await asyncio.sleep(next_at - t1)
+
+
+async def serve(args):
+    server = SlitherServer(args.tick_rate, args.snapshot_rate, args.stats)
+    tcp = await asyncio.start_server(server.serve_tcp, args.host, args.port)
+    print(f"slither server on tcp://{args.host}:{args.port}", flush=True)
+    if args.ws_port:
+        if websockets is None:
+            print("websockets is not installed; WebSocket clients disabled", flush=True)
+        else:
+            await websockets.serve(server.serve_websocket, args.host, args.ws_port)
+            print(f"slither server on ws://{args.host}:{args.ws_port}", flush=True)
+    async with tcp:
+        await server.run()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Authoritative Local Slither.io server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--ws-port", type=int, default=0, help="also accept WebSocket clients here")
+    parser.add_argument("--tick-rate", type=int, default=slither.FPS)
+    parser.add_argument("--snapshot-rate", type=int, default=30)
+    parser.add_argument("--bots", type=int, default=slither.BOT_COUNT)
+    parser.add_argument("--food", type=int, default=slither.FOOD_COUNT)
+    parser.add_argument("--map", default=f"{slither.MAP_WIDTH}x{slither.MAP_HEIGHT}", help="map size as WxH")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--stats", type=float, default=5.0, help="seconds between stats lines (0: off)")
+    args = parser.parse_args(argv)
+    slither.BOT_COUNT, slither.FOOD_COUNT = args.bots, args.food
+    slither.MAP_WIDTH, slither.MAP_HEIGHT = (int(v) for v in args.map.lower().split("x"))
+    random.seed(args.seed)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()